@@ -0,0 +1,201 @@
+"""
+Benchmark of the bulk-load mode of fill.
+
+This script fills fresh databases through main.py with and without
+--bulk-load and prints the wall-clock time and the numbers of fsync and
+fdatasync calls of every run. Calls are counted by a small shim library
+preloaded into the filling process, which is compiled with the C compiler
+of the system; without one, only times are printed.
+
+Run from the root of the repository:
+
+    python benchmarks/bulk_load.py [--users USERS] [--comments COMMENTS]
+                                   [--chunk-size SIZE]
+
+Attributes:
+    ROOT        (str): The root directory of the repository.
+    SHIM_SOURCE (str): The C source of the library counting sync calls.
+
+Functions:
+    - build_shim(): Compiles the library counting sync calls.
+    - run_fill(): Fills fresh databases and measures the fill.
+    - main(): Compares fills with and without bulk-load mode.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SHIM_SOURCE = r"""
+#define _GNU_SOURCE
+#include <dlfcn.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+static long fsync_calls = 0, fdatasync_calls = 0;
+
+int fsync(int fd) {
+    static int (*real)(int);
+    if (!real) real = dlsym(RTLD_NEXT, "fsync");
+    fsync_calls++;
+    return real(fd);
+}
+
+int fdatasync(int fd) {
+    static int (*real)(int);
+    if (!real) real = dlsym(RTLD_NEXT, "fdatasync");
+    fdatasync_calls++;
+    return real(fd);
+}
+
+__attribute__((destructor)) static void report(void) {
+    const char *path = getenv("SYNC_COUNT_PATH");
+    FILE *file = path ? fopen(path, "w") : NULL;
+    if (file) {
+        fprintf(file, "%ld %ld\n", fsync_calls, fdatasync_calls);
+        fclose(file);
+    }
+}
+"""
+
+
+def build_shim(directory: str) -> str | None:
+    """
+    Compiles the library counting sync calls.
+
+    Args:
+        directory (str): The directory to build the library in.
+
+    Returns:
+        str | None: The path of the library, or None if no C compiler
+                    is available or the build failed.
+    """
+
+    compiler = shutil.which("cc") or shutil.which("gcc")
+    if compiler is None or not sys.platform.startswith("linux"):
+        return None
+
+    source = os.path.join(directory, "sync_count.c")
+    library = os.path.join(directory, "sync_count.so")
+
+    with open(source, "w") as file:
+        file.write(SHIM_SOURCE)
+
+    build = subprocess.run(
+        [compiler, "-shared", "-fPIC", "-o", library, source, "-ldl"],
+        capture_output=True
+    )
+
+    return library if build.returncode == 0 else None
+
+
+def run_fill(
+        directory: str,
+        fill_args: list[str],
+        bulk_load: bool,
+        shim: str | None
+) -> tuple[float, tuple[int, int] | None]:
+    """
+    Fills fresh databases through main.py and measures the fill.
+
+    Tables are created in a separate run, so only the fill is measured.
+
+    Args:
+        directory (str): The directory of the databases.
+        fill_args (list[str]): The fill arguments of main.py.
+        bulk_load (bool): If True, fills in bulk-load mode.
+        shim      (str | None): The library counting sync calls, or None.
+
+    Returns:
+        tuple[float, tuple[int, int] | None]: The duration in seconds and
+                                              the numbers of fsync and
+                                              fdatasync calls, or None if
+                                              they were not counted.
+    """
+
+    main_db = os.path.join(directory, "authors.db")
+    logs_db = os.path.join(directory, "logs.db")
+    counts_path = os.path.join(directory, "sync_count.txt")
+
+    for path in (main_db, logs_db, counts_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+    command = [
+        sys.executable, os.path.join(ROOT, "main.py"), "--fill",
+        "--authors-db", main_db, "--logs-db", logs_db
+    ]
+    subprocess.run(command + ["-g"], check=True, capture_output=True)
+
+    env = dict(os.environ)
+    if shim is not None:
+        env["LD_PRELOAD"] = shim
+        env["SYNC_COUNT_PATH"] = counts_path
+
+    started = time.perf_counter()
+    subprocess.run(
+        command + fill_args + (["--bulk-load"] if bulk_load else []),
+        check=True, env=env
+    )
+    duration = time.perf_counter() - started
+
+    if shim is None or not os.path.exists(counts_path):
+        return duration, None
+
+    with open(counts_path) as file:
+        fsync_calls, fdatasync_calls = map(int, file.read().split())
+
+    return duration, (fsync_calls, fdatasync_calls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users",
+        type=int,
+        default=2000,
+        help="Number of users, with a tenth as many blogs and five times "
+             "as many posts"
+    )
+    parser.add_argument("--comments",
+        type=int,
+        default=50000,
+        help="Number of comments"
+    )
+    parser.add_argument("--chunk-size",
+        type=int,
+        default=1000,
+        help="Number of rows generated and inserted per transaction"
+    )
+    args = parser.parse_args()
+
+    fill_args = [
+        "-u", str(args.users), "-b", str(args.users // 10),
+        "-p", str(5 * args.users), "-c", str(args.comments), "-l", "3",
+        "--chunk-size", str(args.chunk_size),
+        "--generator", "synthetic", "--seed", "0"
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        shim = build_shim(directory)
+
+        for bulk_load in (False, True):
+            duration, counts = run_fill(directory, fill_args, bulk_load, shim)
+            mode = "bulk-load" if bulk_load else "default"
+
+            if counts is None:
+                print(f"{mode:9s} {duration * 1000:8.0f} ms")
+            else:
+                print(
+                    f"{mode:9s} {duration * 1000:8.0f} ms "
+                    f"{counts[0]:6d} fsync {counts[1]:6d} fdatasync"
+                )
+
+
+if __name__ == "__main__":
+    main()
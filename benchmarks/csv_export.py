@@ -0,0 +1,138 @@
+"""
+Benchmark of streaming reports through CSVWriter.
+
+Reports are written while their rows are consumed, so the peak resident
+memory of a report must not depend on its number of rows. This script
+streams COUNT and 10 * COUNT rows of a comments report through
+converter.CSVWriter into a temporary file, each run in its own process,
+prints the throughput and the peak RSS of every run, and fails unless the
+peak RSS of the larger run stays within TOLERANCE of the smaller one.
+
+Run from the root of the repository:
+
+    python benchmarks/csv_export.py [--count COUNT]
+                                    [--compress {gzip,bz2,xz}]
+
+Attributes:
+    ROOT      (str): The root directory of the repository.
+    TOLERANCE (float): The allowed ratio of the peak RSS of the larger run
+                       to the peak RSS of the smaller run.
+
+Functions:
+    - generate_rows(): Lazily generates rows of a comments report.
+    - measure_export(): Streams a report in a child process and returns
+                        its throughput and peak RSS.
+    - main(): Compares the peak RSS of two reports.
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from script import converter
+
+TOLERANCE = 1.25
+
+
+def generate_rows(count: int) -> Iterator[tuple]:
+    """
+    Lazily generates rows of a comments report.
+
+    Args:
+        count (int): The number of rows to generate.
+
+    Yields:
+        tuple: The login, the post header, the post author and the comments
+               count of a row.
+    """
+
+    for number in range(count):
+        yield (
+            f"user_{number % 1000}",
+            f"Header of post {number}",
+            f"author_{number % 97}",
+            number % 50
+        )
+
+
+def measure_export(count: int, compression: str | None) -> tuple[float, int]:
+    """
+    Streams a comments report into a temporary file in a child process.
+
+    Args:
+        count       (int): The number of rows to write.
+        compression (str | None): The codec compressing the file, or None
+                                  for a plain file.
+
+    Returns:
+        tuple[float, int]: The number of rows written per second and the
+                           peak RSS of the child process in KiB.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        command = [
+            sys.executable, __file__, "--child",
+            os.path.join(directory, "comments.csv"), str(count)
+        ]
+        if compression is not None:
+            command += ["--compress", compression]
+
+        output = subprocess.run(
+            command, check=True, capture_output=True, text=True
+        ).stdout
+
+    rate, peak = output.split()
+    return float(rate), int(peak)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count",
+        type=int,
+        default=200000,
+        help="Number of rows of the smaller report"
+    )
+    parser.add_argument("--compress",
+        choices=converter.COMPRESSIONS,
+        help="Compress the report with the given codec"
+    )
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        path, count = args.child
+
+        csv_writer = converter.CSVWriter(path, path, args.compress)
+        started = time.perf_counter()
+        csv_writer.write_comments(generate_rows(int(count)))
+        duration = time.perf_counter() - started
+
+        print(
+            int(count) / duration,
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        )
+        return
+
+    small_rate, small = measure_export(args.count, args.compress)
+    large_rate, large = measure_export(10 * args.count, args.compress)
+
+    print(f"{args.count} rows: {small_rate:.0f} rows/s, {small} KiB peak RSS")
+    print(
+        f"{10 * args.count} rows: {large_rate:.0f} rows/s, "
+        f"{large} KiB peak RSS"
+    )
+
+    if large > small * TOLERANCE:
+        sys.exit(f"peak RSS grew {large / small:.2f}x with 10x the rows")
+
+
+if __name__ == "__main__":
+    main()
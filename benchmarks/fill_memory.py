@@ -0,0 +1,116 @@
+"""
+Check of the memory bound of the fill pipeline.
+
+Comments are filled in chunks, so the peak resident memory of a fill must
+not depend on the number of inserted rows. This script fills COUNT and
+10 * COUNT comments into fresh databases, each run in its own process, and
+fails unless the peak RSS of the larger run stays within TOLERANCE of the
+smaller one.
+
+Run from the root of the repository:
+
+    python benchmarks/fill_memory.py [--count COUNT] [--chunk-size SIZE]
+
+Attributes:
+    ROOT      (str): The root directory of the repository.
+    TOLERANCE (float): The allowed ratio of the peak RSS of the larger run
+                       to the peak RSS of the smaller run.
+
+Functions:
+    - measure_fill(): Fills comments in a child process and returns its
+                      peak RSS.
+    - main(): Compares the peak RSS of two fills.
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from script import database
+
+TOLERANCE = 1.25
+
+
+def measure_fill(count: int, chunk_size: int) -> int:
+    """
+    Fills comments into fresh databases in a child process.
+
+    Args:
+        count      (int): The number of comments to fill.
+        chunk_size (int): The number of rows inserted per transaction.
+
+    Returns:
+        int: The peak RSS of the child process in KiB.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        main_db = os.path.join(directory, "authors.db")
+        logs_db = os.path.join(directory, "logs.db")
+
+        db_interface = database.DBInterface(main_db, logs_db, seed=0)
+        db_interface.connect()
+        db_interface.create_tables()
+        db_interface.fill_users(100)
+        db_interface.fill_blogs(10)
+        db_interface.fill_posts(100)
+        db_interface.commit()
+        db_interface.disconnect()
+
+        output = subprocess.run(
+            [
+                sys.executable, __file__, "--child",
+                main_db, logs_db, str(count), str(chunk_size)
+            ],
+            check=True, capture_output=True, text=True
+        ).stdout
+
+    return int(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count",
+        type=int,
+        default=20000,
+        help="Number of comments of the smaller fill"
+    )
+    parser.add_argument("--chunk-size",
+        type=int,
+        default=1000,
+        help="Number of rows generated and inserted per transaction"
+    )
+    parser.add_argument("--child", nargs=4, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        main_db, logs_db, count, chunk_size = args.child
+
+        db_interface = database.DBInterface(
+            main_db, logs_db, int(chunk_size), generator="synthetic", seed=0
+        )
+        db_interface.connect()
+        db_interface.fill_comments(int(count))
+        db_interface.commit()
+        db_interface.disconnect()
+
+        print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        return
+
+    small = measure_fill(args.count, args.chunk_size)
+    large = measure_fill(10 * args.count, args.chunk_size)
+
+    print(f"{args.count} comments: {small} KiB peak RSS")
+    print(f"{10 * args.count} comments: {large} KiB peak RSS")
+
+    if large > small * TOLERANCE:
+        sys.exit(f"peak RSS grew {large / small:.2f}x with 10x the rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,65 @@
 import argparse
-import sqlite3
-from script import database, converter
+import concurrent.futures
+import datetime
+import signal
+import sys
+from script import database, converter, misc
+
+def parse_date(value: str) -> datetime.datetime:
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return misc.resolve_date(value)
+
 
 def parse_args():
     decsr = "Get analytics from databases for users's login."
     parser = argparse.ArgumentParser(description=decsr)
 
     parser.add_argument("login", nargs="?", help="Specify the login")
+    parser.add_argument("--logins-file",
+        help="File with a login per line to report on, or - for stdin"
+    )
+
+    parser.add_argument("--since",
+        type=parse_date,
+        help="First day of actions to report, in ISO format or like -7d"
+    )
+    parser.add_argument("--until",
+        type=parse_date,
+        help="Last day of actions to report, in ISO format or like -1d"
+    )
+    parser.add_argument("--cached-statements",
+        type=int,
+        default=128,
+        help="Number of prepared statements kept by the connection"
+    )
+    parser.add_argument("--concurrent",
+        action="store_true",
+        help="Run both reports of a login at once on separate connections"
+    )
+    parser.add_argument("--compress",
+        choices=converter.COMPRESSIONS,
+        help="Compress output files with the given codec"
+    )
+    parser.add_argument("--format",
+        choices=("csv", "columnar", "jsonl"),
+        default="csv",
+        help="Format of output files of login reports"
+    )
+    parser.add_argument("--all-users",
+        action="store_true",
+        help="Export analytics of every user into partitioned files"
+    )
+    parser.add_argument("--export-dir",
+        default="export",
+        help="Output directory for the export of every user"
+    )
+    parser.add_argument("--buckets",
+        type=int,
+        help="Number of files per table in the export instead of a file "
+             "per user"
+    )
 
     parser.add_argument("--authors-db", 
         default="authors.db",
@@ -18,11 +71,11 @@ def parse_args():
     )
     parser.add_argument("--comments-csv", 
         default="comments.csv",
-        help="Output location for comments table"
+        help="Output location for comments table, or - for stdout"
     )
     parser.add_argument("--general-csv", 
         default="general.csv",
-        help="Output location for general actions table"
+        help="Output location for general actions table, or - for stdout"
     )
 
     parser.add_argument("-f", "--fill", 
@@ -31,7 +84,11 @@ def parse_args():
     )
     parser.add_argument("-g", "--create-tables",
         action="store_true",
-        help="Create tables in databases"
+        help="Create tables in databases or upgrade their schema"
+    )
+    parser.add_argument("-i", "--ensure-indexes",
+        action="store_true",
+        help="Create missing indexes in databases"
     )
     parser.add_argument("-u", "--users-count",
         type=int,
@@ -53,49 +110,199 @@ def parse_args():
         type=int,
         help="Add random comments into database"
     )
+    parser.add_argument("--chunk-size",
+        type=int,
+        default=10000,
+        help="Number of rows generated and inserted per transaction"
+    )
+    parser.add_argument("--generator",
+        choices=misc.GENERATOR_MODES,
+        default="auto",
+        help="Source of random data in fill mode"
+    )
+    parser.add_argument("--workers",
+        type=int,
+        default=1,
+        help="Number of processes generating random data in fill mode"
+    )
+    parser.add_argument("--bulk-load",
+        action="store_true",
+        help="Fill databases with fast unsafe settings and deferred indexes"
+    )
+    parser.add_argument("--seed",
+        type=int,
+        help="Seed making fill mode reproducible"
+    )
+    parser.add_argument("--now",
+        type=datetime.datetime.fromisoformat,
+        help="Moment relative dates of random data are counted from"
+    )
+
+    args = parser.parse_args()
+
+    if args.buckets is not None and args.buckets < 1:
+        parser.error("the number of buckets must be at least 1")
+    if args.format == "columnar" and args.compress:
+        parser.error("columnar files are memory-mapped and not compressed")
+    if args.format == "columnar" and converter.STDOUT_PATH in (
+            args.comments_csv, args.general_csv
+    ):
+        parser.error("columnar files are memory-mapped and not streamed")
+    if args.all_users and args.format != "csv":
+        parser.error("the export of every user is written as CSV")
+    if (args.format == "csv" and not args.all_users 
+            and args.comments_csv == args.general_csv):
+        parser.error("CSV tables need separate output locations")
+    if args.concurrent and (
+            not args.login or args.all_users or args.logins_file
+    ):
+        parser.error("concurrent reports are made for a single login")
+    if args.concurrent and args.fill:
+        parser.error("concurrent reports are read-only and do not fill")
+    if args.concurrent and args.comments_csv == args.general_csv:
+        parser.error("concurrent reports need separate output locations")
+
+    return args
+
+
+def get_writer(args):
+    if args.format == "columnar":
+        return converter.ColumnarWriter(args.comments_csv, args.general_csv)
+    if args.format == "jsonl":
+        return converter.JSONLinesWriter(
+            args.comments_csv, args.general_csv, args.compress
+        )
+    return converter.CSVWriter(
+        args.comments_csv, args.general_csv, args.compress
+    )
 
-    return parser.parse_args()
+
+def write_report(args, write, report, *report_args, **report_kwargs):
+    db_interface = database.DBInterface(
+        args.authors_db, args.logs_db, 
+        cached_statements=args.cached_statements
+    )
+    db_interface.connect(read_only=True)
+
+    try:
+        write(report(db_interface, *report_args, **report_kwargs))
+    finally:
+        db_interface.disconnect()
 
 
 if __name__ == "__main__":
     args = parse_args()
+
+    #Stop quietly when a reader of stdout, like head, closes the pipe
+    if hasattr(signal, "SIGPIPE"):
+        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
     
-    db_interface = database.DBInterface(args.authors_db, args.logs_db)
-    db_interface.connect()
+    db_interface = database.DBInterface(
+        args.authors_db, args.logs_db, 
+        args.chunk_size, args.generator, args.workers, 
+        args.seed, args.now, args.cached_statements
+    )
+    db_interface.connect(read_only=args.concurrent)
+
+    if args.all_users:
+
+        csv_writer = converter.PartitionedCSVWriter(
+            args.export_dir, args.buckets, args.compress
+        )
+        csv_writer.write_comments(db_interface.get_all_users_comments_info())
+        csv_writer.write_general(db_interface.get_all_users_actions_info(
+            args.since, args.until
+        ))
 
-    if args.login:
+    elif args.logins_file:
+
+        if args.logins_file == "-":
+            logins_file = sys.stdin
+        else:
+            logins_file = open(args.logins_file, encoding="utf-8")
+
+        with logins_file:
+            db_interface.load_logins(
+                line.strip() for line in logins_file if line.strip()
+            )
+
+        csv_writer = get_writer(args)
+        csv_writer.write_comments(db_interface.get_users_comments_info())
+        csv_writer.write_users_general(db_interface.get_users_actions_info(
+            args.since, args.until
+        ))
+
+    elif args.login and args.concurrent:
+
+        user_ids = db_interface.resolve_login(args.login)
+        csv_writer = get_writer(args)
+
+        #Each report is queried and written by its own thread and connection
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            reports = [
+                executor.submit(
+                    write_report, args, csv_writer.write_comments, 
+                    database.DBInterface.get_user_comments_info, args.login, 
+                    user_ids=user_ids
+                ),
+                executor.submit(
+                    write_report, args, csv_writer.write_general, 
+                    database.DBInterface.get_user_actions_info, 
+                    args.login, args.since, args.until, user_ids=user_ids
+                ),
+            ]
+
+            for report in reports:
+                report.result()
+
+    elif args.login:
         
         comments_list = db_interface.get_user_comments_info(args.login)
-        actions_list = db_interface.get_user_actions_info(args.login)
+        actions_list = db_interface.get_user_actions_info(
+            args.login, args.since, args.until
+        )
         
-        csv_writer = converter.CSVWriter(args.comments_csv, args.general_csv)
+        csv_writer = get_writer(args)
         csv_writer.write_comments(comments_list)
         csv_writer.write_general(actions_list)
     
     elif args.fill:
 
         if args.create_tables:
-            try:
-                db_interface.create_tables()
-            except sqlite3.OperationalError:
-                print("Tables already exist")
+            migrations = db_interface.create_tables()
+
+            for schema, version, description, duration in migrations:
+                print(f"{schema} v{version} {description}: {duration:.3f}s")
+
+            if not migrations:
+                print("Tables are up to date")
+
+        if args.ensure_indexes:
+            db_interface.ensure_indexes()
         
-        if args.users_count:
-            db_interface.fill_users(args.users_count)
+        if args.bulk_load:
+            db_interface.begin_bulk_load()
+
+        try:
+            if args.users_count:
+                db_interface.fill_users(args.users_count)
+
+            if args.blogs_count:
+                db_interface.fill_blogs(args.blogs_count)
 
-        if args.blogs_count:
-            db_interface.fill_blogs(args.blogs_count)
+            if args.posts_count:
+                db_interface.fill_posts(args.posts_count)
 
-        if args.posts_count:
-            db_interface.fill_posts(args.posts_count)
+            if args.comments_count:
+                db_interface.fill_comments(args.comments_count)
 
-        if args.comments_count:
-            db_interface.fill_comments(args.comments_count)
+            if args.actions_count:
+                db_interface.fill_actions(args.actions_count)
 
-        if args.actions_count:
-            for i in range(args.actions_count):
-                db_interface.fill_logs_login_logout(True)
-                db_interface.fill_logs_login_logout(False)
+        finally:
+            #Indexes, triggers and safe settings come back even on failure
+            if args.bulk_load:
+                db_interface.end_bulk_load()
 
         db_interface.commit()
 
@@ -1,3 +1,6 @@
+from . import words
 from . import misc
+from . import sampling
+from . import generation
 from . import database
 from . import converter
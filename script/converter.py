@@ -3,14 +3,150 @@ Module for write operations into CSV files.
 
 This module provides functionality to write structured data to CSV files.
 It includes methods for writing comments data and general data 
-to separate CSV files.
+to separate CSV files, either for a single report or partitioned by user.
+Files may be compressed while they are written by one of the codecs of 
+the standard library. The same tables may also be written to typed 
+columnar files, read back by memory mapping instead of parsing, or to 
+JSON Lines files, which may hold both tables at once.
 
 
+Attributes:
+    WRITE_BUFFER_SIZE   (int): The size in bytes of the buffer of written 
+                               files.
+    COMPRESSIONS        (dict[str, tuple]): The compression codecs by name, 
+                                            as the opener of compressed 
+                                            files, the extension of the 
+                                            files and the options of the 
+                                            opener.
+    PARTITION_OPTIONS   (dict[str, dict]): The options of the openers of 
+                                           partitioned files by codec name, 
+                                           replacing those of COMPRESSIONS.
+    STDOUT_PATH         (str): The path standing for the standard output.
+    COLUMNAR_MAGIC      (bytes): The first bytes of columnar files.
+    COLUMNAR_HEADER     (struct.Struct): The header of columnar files.
+    COLUMNAR_DESCRIPTOR (struct.Struct): The descriptor of a column of 
+                                         columnar files.
+    COLUMNAR_NULLS      (dict[str, int]): The values standing for NULL in 
+                                          columns of columnar files by 
+                                          field type.
+    EPOCH_DATE          (datetime.date): The day 0 of date columns.
+
+Functions:
+    - open_output(): Opens a text file for writing, optionally compressed.
+    - read_columns(): Reads a columnar file written by ColumnarWriter.
+
 Classes:
     CSVWriter: A class for interacting with CSV files.
+    PartitionedCSVWriter: A class for writing CSV files partitioned by user.
+    ColumnarWriter: A class for writing typed columnar files.
+    JSONLinesWriter: A class for writing JSON Lines files.
 """
 
+import array
+import bz2
 import csv
+import datetime
+import gzip
+import io
+import itertools
+import json
+import lzma
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Iterable
+
+WRITE_BUFFER_SIZE = 1 << 20
+
+COMPRESSIONS = {
+    "gzip": (gzip.open, ".gz", {"compresslevel": 1}),
+    "bz2": (bz2.open, ".bz2", {"compresslevel": 9}),
+    "xz": (lzma.open, ".xz", {"preset": 6}),
+}
+
+#Every bucket keeps its own encoder, which takes about 90 MiB with the 
+#default preset of xz and about 1 MiB with a small dictionary
+PARTITION_OPTIONS = {
+    "xz": {
+        "filters": [
+            {"id": lzma.FILTER_LZMA2, "preset": 0, "dict_size": 1 << 16}
+        ]
+    },
+}
+
+STDOUT_PATH = "-"
+
+COLUMNAR_MAGIC = b"PYDBSCOL"
+COLUMNAR_HEADER = struct.Struct("<8sQQ")
+COLUMNAR_DESCRIPTOR = struct.Struct("<32s8sQQQ")
+COLUMNAR_NULLS = {"text": -1, "date": -2**31, "int": -2**63}
+EPOCH_DATE = datetime.date(1970, 1, 1)
+
+
+def open_output(
+        path: str, 
+        compression: str | None = None,
+        buffering: int = WRITE_BUFFER_SIZE,
+        append: bool = False,
+        options: dict | None = None
+) -> io.TextIOBase:
+    """
+    Opens a text file for writing, optionally compressed.
+
+    The extension of the codec is appended to the path unless it already 
+    ends with it. Without a codec, the codec is taken from the extension 
+    of the path, so "comments.csv.gz" is written compressed by gzip. The 
+    path STDOUT_PATH stands for the standard output, which is left open 
+    when the returned file is closed.
+
+    Args:
+        path        (str): The path of the file.
+        compression (str | None): The name of the codec, a key of 
+                                  COMPRESSIONS, or None to choose it by 
+                                  the extension of the path.
+        buffering   (int): The size in bytes of the buffer of the file.
+                           Defaults to WRITE_BUFFER_SIZE.
+        append      (bool): If True, appends to the file instead of 
+                            truncating it. Defaults to False.
+        options     (dict | None): The options of the opener replacing 
+                                   those of the codec, or None to keep 
+                                   them. Defaults to None.
+
+    Returns:
+        io.TextIOBase: The file, writing rows without newline translation.
+    """
+
+    mode = 'ab' if append else 'wb'
+
+    if path == STDOUT_PATH:
+        sys.stdout.flush()
+        target = open(sys.stdout.fileno(), mode, buffering=0, closefd=False)
+    else:
+        target = path
+
+    if compression is None and path != STDOUT_PATH:
+        compression = next((
+            name for name, (_, extension, _) in COMPRESSIONS.items()
+            if path.endswith(extension)
+        ), None)
+
+    if compression is None:
+        if path != STDOUT_PATH:
+            target = open(path, mode, buffering=0)
+        binary = target
+    else:
+        opener, extension, codec_options = COMPRESSIONS[compression]
+        if options is None:
+            options = codec_options
+        if path != STDOUT_PATH and not path.endswith(extension):
+            target += extension
+        binary = opener(target, mode, **options)
+
+    return io.TextIOWrapper(
+        io.BufferedWriter(binary, buffering), newline=''
+    )
+
 
 class CSVWriter:
     """
@@ -19,68 +155,646 @@ class CSVWriter:
     Attributes:
         comments_dir (str): The directory path for writing comments data.
         general_dir  (str): The directory path for writing general data.
+        compression  (str | None): The codec compressing the files, or None 
+                                   to choose it by their extensions.
 
     Methods:
         - write_comments(): Writes comments data to a CSV file 
                             specified by comments_dir.
         - write_general(): Writes general actions data to a CSV file 
                            specified by general_dir.
+        - write_users_general(): Writes general actions data of several 
+                                 users to a CSV file specified by 
+                                 general_dir.
     """
 
-    def __init__(self, comments_dir: str, general_dir: str):
+    def __init__(self, 
+            comments_dir: str, 
+            general_dir: str, 
+            compression: str | None = None
+    ):
         """
         Initializes the CSVWriter instance.
 
         Args:
             comments_dir (str): The directory path for writing comments data.
             general_dir  (str): The directory path for writing general data.
+            compression  (str | None): The codec compressing the files, a 
+                                       key of COMPRESSIONS, or None to 
+                                       choose it by their extensions. 
+                                       Defaults to None.
         """
 
         self.comments_dir = comments_dir
         self.general_dir = general_dir
+        self.compression = compression
 
 
     def __writer__(self, 
             obj_dir: str, 
             field_names: list[str], 
-            table: list[tuple]
+            table: Iterable[tuple]
     ):
         """
         Writes data to a CSV file.
 
+        Rows are written while they are consumed, so the table may be a 
+        lazy iterator of any length. They are written as they are, in the 
+        order of field names, through a large file buffer.
+
         Args:
             obj_dir     (str): The directory path for the CSV file.
             field_names (list[str]): The list of field names for the CSV file.
-            table       (list[tuple]): The data to be written to the CSV file.
+            table       (Iterable[tuple]): The data to be written to the CSV 
+                                           file.
         """
 
-        with open(obj_dir, 'w', newline='') as csv_file:
-            writer = csv.DictWriter(csv_file, fieldnames=field_names)
+        with open_output(obj_dir, self.compression) as csv_file:
+            writer = csv.writer(csv_file)
 
-            writer.writeheader()
-            for row in table:
-                writer.writerow(dict(zip(field_names, row)))
+            writer.writerow(field_names)
+            writer.writerows(table)
 
 
-    def write_comments(self, table: list[tuple]):
+    def write_comments(self, table: Iterable[tuple]):
         """
         Writes comments data to a CSV file.
 
         Args:
-            table (list[tuple]): The comments data to be written.
+            table (Iterable[tuple]): The comments data to be written.
         """
 
         field_names = ["login", "post_header", "post_author", "comments_count"]
         self.__writer__(self.comments_dir, field_names, table)
 
 
-    def write_general(self, table: list[tuple]):
+    def write_general(self, table: Iterable[tuple]):
         """
         Writes general actions data to a CSV file.
 
         Args:
-            table (list[tuple]): The general actions data to be written.
+            table (Iterable[tuple]): The general actions data to be written.
         """
 
         field_names = ["date", "logins", "logouts", "actions_count"]
         self.__writer__(self.general_dir, field_names, table)
+
+
+    def write_users_general(self, table: Iterable[tuple]):
+        """
+        Writes general actions data of several users to a CSV file.
+
+        Args:
+            table (Iterable[tuple]): The general actions data to be written, 
+                                     prefixed by the login of the user.
+        """
+
+        field_names = ["login", "date", "logins", "logouts", "actions_count"]
+        self.__writer__(self.general_dir, field_names, table)
+
+
+class PartitionedCSVWriter:
+    """
+    A utility class for writing data of many users to partitioned CSV 
+    files.
+
+    Rows are expected in user order and prefixed by the ID of the user. 
+    Without buckets, every user gets own files named by the ID, and only 
+    the file of the current user is open. With buckets, users are spread 
+    over a fixed number of files by ID, every row keeps the ID of its user, 
+    and at most one file per bucket is open. In both cases memory does not 
+    depend on the number of rows. Compressed files are written with the 
+    options of PARTITION_OPTIONS, as each open file holds its own 
+    encoder.
+
+    Attributes:
+        directory   (str): The directory path for writing the partitions.
+        buckets     (int | None): The number of files per table, or None 
+                                  for a file per user.
+        compression (str | None): The codec compressing the files, or None 
+                                  for plain files.
+        options     (dict | None): The options of the opener of compressed 
+                                   files, or None for those of the codec.
+
+    Methods:
+        - write_comments(): Writes comments data of users to the comments 
+                            subdirectory.
+        - write_general(): Writes general actions data of users to the 
+                           general subdirectory.
+    """
+
+    def __init__(self, 
+            directory: str, 
+            buckets: int | None = None,
+            compression: str | None = None
+    ):
+        """
+        Initializes the PartitionedCSVWriter instance.
+
+        Args:
+            directory   (str): The directory path for writing the 
+                               partitions.
+            buckets     (int | None): The number of files per table, or 
+                                      None for a file per user. Defaults 
+                                      to None.
+            compression (str | None): The codec compressing the files, a 
+                                      key of COMPRESSIONS, or None for 
+                                      plain files. Defaults to None.
+        """
+
+        self.directory = directory
+        self.buckets = buckets
+        self.compression = compression
+        self.options = PARTITION_OPTIONS.get(compression)
+
+
+    def __writer__(self, 
+            obj_dir: str, 
+            field_names: list[str], 
+            table: Iterable[tuple]
+    ):
+        """
+        Writes data of users to partitioned CSV files.
+
+        Args:
+            obj_dir     (str): The directory path for the partitions.
+            field_names (list[str]): The list of field names for the CSV 
+                                     files, without the user ID.
+            table       (Iterable[tuple]): The data to be written, in user 
+                                           order and prefixed by the ID 
+                                           of the user.
+        """
+
+        os.makedirs(obj_dir, exist_ok=True)
+
+        if self.buckets is None:
+            for user_id, rows in itertools.groupby(table, lambda row: row[0]):
+                path = os.path.join(obj_dir, f"{user_id}.csv")
+                with open_output(
+                        path, self.compression, options=self.options
+                ) as csv_file:
+                    writer = csv.writer(csv_file)
+                    writer.writerow(field_names)
+                    writer.writerows(row[1:] for row in rows)
+            return
+
+        files = {}
+        writers = {}
+        try:
+            for row in table:
+                bucket = row[0] % self.buckets
+                if bucket not in writers:
+                    path = os.path.join(obj_dir, f"bucket_{bucket}.csv")
+                    files[bucket] = open_output(
+                        path, self.compression, io.DEFAULT_BUFFER_SIZE, 
+                        options=self.options
+                    )
+                    writers[bucket] = csv.writer(files[bucket])
+                    writers[bucket].writerow(["user_id"] + field_names)
+                writers[bucket].writerow(row)
+        finally:
+            for csv_file in files.values():
+                csv_file.close()
+
+
+    def write_comments(self, table: Iterable[tuple]):
+        """
+        Writes comments data of users to the comments subdirectory.
+
+        Args:
+            table (Iterable[tuple]): The comments data to be written, 
+                                     prefixed by the ID of the user.
+        """
+
+        field_names = ["login", "post_header", "post_author", "comments_count"]
+        self.__writer__(
+            os.path.join(self.directory, "comments"), field_names, table
+        )
+
+
+    def write_general(self, table: Iterable[tuple]):
+        """
+        Writes general actions data of users to the general subdirectory.
+
+        Args:
+            table (Iterable[tuple]): The general actions data to be written, 
+                                     prefixed by the ID of the user.
+        """
+
+        field_names = ["date", "logins", "logouts", "actions_count"]
+        self.__writer__(
+            os.path.join(self.directory, "general"), field_names, table
+        )
+
+
+class ColumnarWriter:
+    """
+    A utility class for writing data to typed columnar files.
+
+    Every column is stored as a contiguous little-endian array, so the 
+    files are read by read_columns() or numpy.memmap without parsing. 
+    Text columns are dictionary-encoded: the column holds 32-bit codes 
+    into a dictionary of distinct values stored once. Dates are stored as 
+    32-bit numbers of days since 1970-01-01. NULL is stored as a value of 
+    COLUMNAR_NULLS: the code -1 in text columns, and the smallest integer 
+    of the column type in date and integer columns.
+
+    A file starts with a header of COLUMNAR_HEADER, the magic bytes, the 
+    number of rows and the number of columns, followed by a descriptor of 
+    COLUMNAR_DESCRIPTOR per column: the name, the typecode of the array 
+    module ("i" for 32-bit and "q" for 64-bit integers), the offset of the 
+    data, the number of dictionary values and the offset of the 
+    dictionary, which is 0 for columns other than text. A dictionary is 
+    made of the 64-bit offsets of its k values followed by the end of the 
+    last value, k + 1 offsets in all, relative to the first byte after 
+    them, where the UTF-8 values follow. Data and dictionaries start at 
+    offsets aligned to 8 bytes.
+
+    Attributes:
+        comments_dir (str): The directory path for writing comments data.
+        general_dir  (str): The directory path for writing general data.
+
+    Methods:
+        - write_comments(): Writes comments data to a columnar file 
+                            specified by comments_dir.
+        - write_general(): Writes general actions data to a columnar file 
+                           specified by general_dir.
+        - write_users_general(): Writes general actions data of several 
+                                 users to a columnar file specified by 
+                                 general_dir.
+    """
+
+    def __init__(self, comments_dir: str, general_dir: str):
+        """
+        Initializes the ColumnarWriter instance.
+
+        Args:
+            comments_dir (str): The directory path for writing comments data.
+            general_dir  (str): The directory path for writing general data.
+        """
+
+        self.comments_dir = comments_dir
+        self.general_dir = general_dir
+
+
+    def __writer__(self, 
+            obj_dir: str, 
+            field_types: dict[str, str], 
+            table: Iterable[tuple]
+    ):
+        """
+        Writes data to a columnar file.
+
+        Columns are accumulated in arrays while rows are consumed, which 
+        costs 4 or 8 bytes per value, and every distinct text once.
+
+        Args:
+            obj_dir     (str): The directory path for the columnar file.
+            field_types (dict[str, str]): The types of fields by name: 
+                                          "text", "date" or "int".
+            table       (Iterable[tuple]): The data to be written to the 
+                                           columnar file.
+        """
+
+        types = list(field_types.values())
+        columns = [
+            array.array("q" if field_type == "int" else "i") 
+            for field_type in types
+        ]
+        dictionaries = [{} for _ in types]
+        count = 0
+
+        for row in table:
+            for value, field_type, column, dictionary in zip(
+                    row, types, columns, dictionaries
+            ):
+                if value is None:
+                    column.append(COLUMNAR_NULLS[field_type])
+                    continue
+
+                if field_type == "int":
+                    column.append(value)
+                    continue
+
+                code = dictionary.get(value)
+                if code is None:
+                    code = len(dictionary)
+                    dictionary[value] = code
+                column.append(code)
+            count += 1
+
+        for index, field_type in enumerate(types):
+            if field_type == "date":
+                #Distinct dates are collected first, then converted once
+                days = array.array("i", (
+                    (datetime.date.fromisoformat(day) - EPOCH_DATE).days 
+                    for day in dictionaries[index]
+                ))
+                null = COLUMNAR_NULLS["date"]
+                columns[index] = array.array("i", (
+                    null if code == null else days[code] 
+                    for code in columns[index]
+                ))
+                dictionaries[index] = {}
+
+        with open(obj_dir, 'wb', buffering=WRITE_BUFFER_SIZE) as file:
+            offset = (
+                COLUMNAR_HEADER.size 
+                + COLUMNAR_DESCRIPTOR.size * len(types)
+            )
+            descriptors = []
+            blocks = []
+
+            for name, field_type, column, dictionary in zip(
+                    field_types, types, columns, dictionaries
+            ):
+                data_offset = offset
+                offset = _align(offset + column.itemsize * len(column))
+
+                dictionary_offset = 0
+                if field_type == "text":
+                    values = [value.encode() for value in dictionary]
+                    offsets = array.array(
+                        "q", itertools.accumulate(map(len, values), initial=0)
+                    )
+                    dictionary_offset = offset
+                    offset = _align(
+                        offset + offsets.itemsize * len(offsets) 
+                        + offsets[-1]
+                    )
+                    blocks.append((data_offset, column))
+                    blocks.append((dictionary_offset, offsets))
+                    blocks.append((None, b"".join(values)))
+                else:
+                    blocks.append((data_offset, column))
+
+                descriptors.append(COLUMNAR_DESCRIPTOR.pack(
+                    name.encode(), column.typecode.encode(), 
+                    data_offset, len(dictionary), dictionary_offset
+                ))
+
+            file.write(COLUMNAR_HEADER.pack(
+                COLUMNAR_MAGIC, count, len(types)
+            ))
+            file.write(b"".join(descriptors))
+
+            for block_offset, block in blocks:
+                if block_offset is not None:
+                    file.write(b"\0" * (block_offset - file.tell()))
+                if isinstance(block, array.array) and sys.byteorder == "big":
+                    block = array.array(block.typecode, block)
+                    block.byteswap()
+                file.write(block)
+
+
+    def write_comments(self, table: Iterable[tuple]):
+        """
+        Writes comments data to a columnar file.
+
+        Args:
+            table (Iterable[tuple]): The comments data to be written.
+        """
+
+        field_types = {
+            "login": "text", 
+            "post_header": "text", 
+            "post_author": "text", 
+            "comments_count": "int"
+        }
+        self.__writer__(self.comments_dir, field_types, table)
+
+
+    def write_general(self, table: Iterable[tuple]):
+        """
+        Writes general actions data to a columnar file.
+
+        Args:
+            table (Iterable[tuple]): The general actions data to be written.
+        """
+
+        field_types = {
+            "date": "date", 
+            "logins": "int", 
+            "logouts": "int", 
+            "actions_count": "int"
+        }
+        self.__writer__(self.general_dir, field_types, table)
+
+
+    def write_users_general(self, table: Iterable[tuple]):
+        """
+        Writes general actions data of several users to a columnar file.
+
+        Args:
+            table (Iterable[tuple]): The general actions data to be written, 
+                                     prefixed by the login of the user.
+        """
+
+        field_types = {
+            "login": "text", 
+            "date": "date", 
+            "logins": "int", 
+            "logouts": "int", 
+            "actions_count": "int"
+        }
+        self.__writer__(self.general_dir, field_types, table)
+
+
+class JSONLinesWriter:
+    """
+    A utility class for writing data to JSON Lines files.
+
+    Every row is written as a JSON object on its own line, with the "type" 
+    key telling the table it belongs to, "comments" or "general". When 
+    both tables go to the same path, for example STDOUT_PATH, the second 
+    table is appended after the first one, so a single stream holds both 
+    and consumers tell them apart by the type.
+
+    Attributes:
+        comments_dir (str): The directory path for writing comments data.
+        general_dir  (str): The directory path for writing general data.
+        compression  (str | None): The codec compressing the files, or None 
+                                   to choose it by their extensions.
+        opened       (set[str]): The paths already written by the writer.
+
+    Methods:
+        - write_comments(): Writes comments data to a JSON Lines file 
+                            specified by comments_dir.
+        - write_general(): Writes general actions data to a JSON Lines 
+                           file specified by general_dir.
+        - write_users_general(): Writes general actions data of several 
+                                 users to a JSON Lines file specified by 
+                                 general_dir.
+    """
+
+    def __init__(self, 
+            comments_dir: str, 
+            general_dir: str, 
+            compression: str | None = None
+    ):
+        """
+        Initializes the JSONLinesWriter instance.
+
+        Args:
+            comments_dir (str): The directory path for writing comments data.
+            general_dir  (str): The directory path for writing general data.
+            compression  (str | None): The codec compressing the files, a 
+                                       key of COMPRESSIONS, or None to 
+                                       choose it by their extensions. 
+                                       Defaults to None.
+        """
+
+        self.comments_dir = comments_dir
+        self.general_dir = general_dir
+        self.compression = compression
+        self.opened = set()
+
+
+    def __writer__(self, 
+            obj_dir: str, 
+            record_type: str, 
+            field_names: list[str], 
+            table: Iterable[tuple]
+    ):
+        """
+        Writes data to a JSON Lines file.
+
+        Lines are joined in batches and pass through a large file buffer, 
+        so the file is written in large chunks instead of once per row.
+
+        Args:
+            obj_dir     (str): The directory path for the JSON Lines file.
+            record_type (str): The value of the "type" key of every line.
+            field_names (list[str]): The list of field names for the rows.
+            table       (Iterable[tuple]): The data to be written to the 
+                                           JSON Lines file.
+        """
+
+        encode = json.JSONEncoder(
+            ensure_ascii=False, check_circular=False, separators=(",", ":")
+        ).encode
+
+        #The keys are encoded once into a template of the objects
+        template = "{" + ",".join(
+            [f'"type":{encode(record_type)}'] 
+            + [f"{encode(name)}:%s" for name in field_names]
+        ) + "}"
+        rows = (template % tuple(map(encode, row)) for row in table)
+
+        with open_output(
+                obj_dir, self.compression, append=obj_dir in self.opened
+        ) as jsonl_file:
+            self.opened.add(obj_dir)
+
+            while batch := list(itertools.islice(rows, 1024)):
+                jsonl_file.write("\n".join(batch) + "\n")
+
+
+    def write_comments(self, table: Iterable[tuple]):
+        """
+        Writes comments data to a JSON Lines file.
+
+        Args:
+            table (Iterable[tuple]): The comments data to be written.
+        """
+
+        field_names = ["login", "post_header", "post_author", "comments_count"]
+        self.__writer__(self.comments_dir, "comments", field_names, table)
+
+
+    def write_general(self, table: Iterable[tuple]):
+        """
+        Writes general actions data to a JSON Lines file.
+
+        Args:
+            table (Iterable[tuple]): The general actions data to be written.
+        """
+
+        field_names = ["date", "logins", "logouts", "actions_count"]
+        self.__writer__(self.general_dir, "general", field_names, table)
+
+
+    def write_users_general(self, table: Iterable[tuple]):
+        """
+        Writes general actions data of several users to a JSON Lines file.
+
+        Args:
+            table (Iterable[tuple]): The general actions data to be written, 
+                                     prefixed by the login of the user.
+        """
+
+        field_names = ["login", "date", "logins", "logouts", "actions_count"]
+        self.__writer__(self.general_dir, "general", field_names, table)
+
+
+def _align(offset: int) -> int:
+    """
+    Rounds an offset of a columnar file up to a multiple of 8 bytes.
+
+    Args:
+        offset (int): The offset in bytes.
+
+    Returns:
+        int: The aligned offset.
+    """
+
+    return (offset + 7) & ~7
+
+
+def read_columns(path: str) -> dict[str, memoryview | tuple]:
+    """
+    Reads a columnar file written by ColumnarWriter.
+
+    The file is memory-mapped and columns are views of the mapping, so no 
+    value is parsed or copied. Only the distinct values of dictionaries 
+    are decoded. On big-endian machines, views hold byte-swapped values.
+
+    Args:
+        path (str): The path of the columnar file.
+
+    Returns:
+        dict[str, memoryview | tuple]: The columns by name. Integer and 
+                                       date columns are views of integers, 
+                                       text columns are pairs of a view 
+                                       of codes and the list of values. 
+                                       The list ends with None, so the 
+                                       NULL code -1 indexes None.
+
+    Raises:
+        ValueError: If the file is not a columnar file.
+    """
+
+    with open(path, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    data = memoryview(mapping)
+    magic, count, column_count = COLUMNAR_HEADER.unpack_from(data)
+    if magic != COLUMNAR_MAGIC:
+        raise ValueError(f"Not a columnar file: {path}")
+
+    columns = {}
+    for index in range(column_count):
+        name, typecode, offset, size, dictionary_offset = (
+            COLUMNAR_DESCRIPTOR.unpack_from(
+                data, 
+                COLUMNAR_HEADER.size + COLUMNAR_DESCRIPTOR.size * index
+            )
+        )
+        typecode = typecode.rstrip(b"\0").decode()
+        itemsize = array.array(typecode).itemsize
+        column = data[offset:offset + itemsize * count].cast(typecode)
+
+        if dictionary_offset:
+            offsets = data[
+                dictionary_offset:dictionary_offset + 8 * (size + 1)
+            ].cast("q")
+            start = dictionary_offset + 8 * (size + 1)
+            values = [
+                bytes(data[start + low:start + high]).decode()
+                for low, high in zip(offsets, offsets[1:])
+            ]
+            column = (column, values + [None])
+
+        columns[name.rstrip(b"\0").decode()] = column
+
+    return columns
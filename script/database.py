@@ -7,35 +7,163 @@ methods for generating random data, primarily intended for testing purposes.
 
 
 Classes:
+    Migration: A class describing a step of the schema evolution.
     DBInterface: A class for interacting with databases.
 """
 
 import sqlite3 
 import random
+import re
+import time
+import datetime
+import array
+import json
+import collections
+import itertools
+import pathlib
+from collections.abc import Iterable, Iterator
 
 from . import misc
+from . import generation
+from . import sampling
+
+class Migration:
+    """
+    A single step of the schema evolution of one database.
+
+    A migration either runs a script of SQL statements, creating indexes 
+    declared in DBInterface.INDEXES after it, or backfills a table chunk 
+    by chunk. A backfill query is executed once per chunk of 
+    rows of the table with the named parameters :start and :stop bounding 
+    the values of the key column of the chunk, and must give the same 
+    result when run again.
+
+    Attributes:
+        description (str): The short description of the migration.
+        script      (str | None): The SQL statements of the migration.
+        backfill    (str | None): The query backfilling a chunk of rows.
+        table       (str | None): The table backfilled by the migration.
+        key         (str): The integer column the chunks are bounded by.
+        indexes     (tuple[str]): The names of indexes of 
+                                  DBInterface.INDEXES created by the 
+                                  migration.
+    """
+
+    def __init__(self, 
+            description: str, 
+            script: str | None = None,
+            backfill: str | None = None,
+            table: str | None = None,
+            key: str = "id",
+            indexes: tuple[str] = ()
+    ):
+        """
+        Initializes the Migration instance.
+
+        Args:
+            description (str): The short description of the migration.
+            script      (str | None): The SQL statements of the migration.
+            backfill    (str | None): The query backfilling a chunk of rows.
+            table       (str | None): The table backfilled by the migration.
+            key         (str): The integer column the chunks are bounded by.
+                               Defaults to "id".
+            indexes     (tuple[str]): The names of indexes of 
+                                      DBInterface.INDEXES created by the 
+                                      migration. Defaults to none.
+        """
+
+        self.description = description
+        self.script = script
+        self.backfill = backfill
+        self.table = table
+        self.key = key
+        self.indexes = indexes
+
 
 class DBInterface:
     """
     DBInterface class for managing database connections and operations.
 
     Attributes:
+        SCHEMAS             (tuple[str]): The names of both databases in 
+                                          the connection.
+        BULK_LOAD_PRAGMAS   (dict[str, str | int]): The settings of both 
+                                                    databases in bulk-load 
+                                                    mode.
+        BULK_LOAD_REFRESHES (dict[str, str]): The queries recomputing data 
+                                              maintained by triggers for 
+                                              rows inserted in bulk-load 
+                                              mode, by the table of the 
+                                              rows. Rows with IDs above 
+                                              :mark are the inserted ones.
+        INDEXES             (dict[str, tuple]): The secondary indexes by 
+                                                name, as the schema, the 
+                                                table and the indexed 
+                                                columns.
+        MIGRATIONS          (dict[str, tuple[Migration]]): The ordered 
+                                                           migrations of 
+                                                           both databases.
+        QUERIES             (dict[str, str]): The queries of reports by 
+                                              name. Values are always 
+                                              bound as parameters, so 
+                                              every query has a single 
+                                              text, prepared once per 
+                                              connection.
+        LOGIN_CACHE_SIZE    (int): The number of logins kept in the login 
+                                   cache.
+        FETCH_SIZE          (int): The number of rows of reports fetched 
+                                   at once.
         main_db_location    (str): The location of the main database.
         logging_db_location (str): The location of the logging database.
+        cached_statements   (int): The number of prepared statements kept 
+                                   by the connection.
+        chunk_size          (int): The number of rows inserted per 
+                                   transaction by fill methods.
+        generator           (str): The generator mode of random data.
+        workers             (int): The number of processes generating 
+                                   rows for fill methods.
+        random              (random.Random): The generator of seeds of 
+                                             chunks for fill methods.
+        provider            (misc.FakeDataProvider | 
+                             misc.SyntheticDataProvider): The generator of 
+                                                          random data for 
+                                                          fill methods.
         connection          (sqlite3.Connection): The connection object 
                                                   to the main database.
         cursor              (sqlite3.Cursor): The cursor object for 
                                               executing SQL statements.
+        id_cache            (dict[str, range | array.array]): The IDs of 
+                                                          tables 
+                                                          referenced by 
+                                                          fill methods.
+        login_cache         (collections.OrderedDict[str, tuple[int]]): 
+                                The IDs of users by login, from the least 
+                                to the most recently used.
+        data_version        (int | None): The data version of the main 
+                                          database the id and login caches 
+                                          are valid for.
+        bulk_load_state     (dict | None): The settings saved by 
+                                           begin_bulk_load(), or None 
+                                           outside of bulk-load mode.
 
     Methods:
         - connect(): Establishes connection to the main and logging databases.
         - commit(): Commits the current transaction to the main database.
         - disconnect(): Disconnects from both the main and logging databases.
         - create_tables(): Creates tables in the main and logging databases.
+        - migrate(): Applies pending migrations to both databases.
+        - ensure_indexes(): Creates the declared secondary indexes.
+        - begin_bulk_load(): Switches both databases to bulk-load mode.
+        - end_bulk_load(): Rebuilds indexes and restores safe settings 
+                           after bulk-load mode.
         - fill_users(): Inserts dummy user data into the main database.
         - fill_blogs(): Inserts dummy blog data into the main database.
         - fill_logs_login_logout(): Inserts login or logout data into the 
                                     logging database.
+        - fill_actions(): Inserts rounds of login and logout data into the 
+                          logging database.
+        - clear_id_cache(): Forgets the cached IDs of tables and users.
+        - resolve_login(): Retrieves the IDs of users with a login.
         - fill_posts(): Inserts dummy post data into the main and logging 
                         databases.
         - fill_comments(): Inserts dummy comment data into the main and 
@@ -44,33 +172,505 @@ class DBInterface:
                                     from the main database.
         - get_user_actions_info(): Retrieves user actions information 
                                    from the logging database.
+        - load_logins(): Loads logins for batch reports into a temporary 
+                         table.
+        - get_users_comments_info(): Retrieves comments information of 
+                                     all loaded logins.
+        - get_users_actions_info(): Retrieves actions information of all 
+                                    loaded logins.
+        - get_all_users_comments_info(): Retrieves comments information of 
+                                         every user in user order.
+        - get_all_users_actions_info(): Retrieves actions information of 
+                                        every user in user order.
     """
 
-    def __init__(self, main_db_location: str, logging_db_location: str):
+    SCHEMAS = ("main", "logging")
+
+    BULK_LOAD_PRAGMAS = {
+        "locking_mode": "EXCLUSIVE",
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "cache_size": -262144,
+    }
+
+    BULK_LOAD_REFRESHES = {
+        "main.comment": """
+            UPDATE main.post 
+            SET comments_count = (
+                SELECT count(*) FROM main.comment AS cmt 
+                WHERE cmt.post_id = post.id
+            ) 
+            WHERE id IN (SELECT post_id FROM main.comment WHERE id > :mark)
+        """,
+        "logging.logs": """
+            INSERT OR REPLACE INTO logging.user_daily_activity 
+            SELECT 
+                new.user_id, 
+                new.day, 
+                count(CASE WHEN lg.event_type_id == 1 THEN 1 END), 
+                count(CASE WHEN lg.event_type_id == 5 THEN 1 END), 
+                count(CASE WHEN lg.space_type_id > 1 THEN 1 END), 
+                count(*)
+            FROM 
+                (
+                    SELECT DISTINCT user_id, ts / 86400 AS day 
+                    FROM logging.logs NOT INDEXED 
+                    WHERE id > :mark
+                ) AS new 
+                JOIN logging.logs AS lg 
+                    ON lg.user_id = new.user_id 
+                    AND lg.ts >= new.day * 86400 
+                    AND lg.ts < (new.day + 1) * 86400
+            GROUP BY new.user_id, new.day
+        """,
+    }
+
+    INDEXES = {
+        "users_login_idx": ("main", "users", ("login",)),
+        "comment_author_idx": ("main", "comment", ("author_id", "post_id")),
+        "comment_post_idx": ("main", "comment", ("post_id",)),
+        "logs_user_ts_idx": ("logging", "logs", ("user_id", "ts")),
+    }
+
+    MIGRATIONS = {
+        "main": (
+            Migration("create tables", script="""
+                CREATE TABLE IF NOT EXISTS main.users (
+                    "id"            INTEGER NOT NULL PRIMARY KEY,
+                    "email"         TEXT,
+                    "login"         TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS main.blog (
+                    "id"            INTEGER NOT NULL PRIMARY KEY,
+                    "owner_id"      INTEGER,
+                    "name"          TEXT NOT NULL,
+                    "description"   TEXT,
+                    FOREIGN KEY("owner_id") REFERENCES "users"("id") 
+                                            ON DELETE SET NULL
+                );
+                CREATE TABLE IF NOT EXISTS main.post (
+                    "id"            INTEGER NOT NULL PRIMARY KEY,
+                    "header"        TEXT NOT NULL,
+                    "text"          TEXT,
+                    "author_id"     INTEGER,
+                    "blog_id"       INTEGER,
+                    FOREIGN KEY("blog_id") REFERENCES "blog"("id") 
+                                           ON DELETE SET NULL,
+                    FOREIGN KEY("author_id") REFERENCES "users"("id") 
+                                             ON DELETE SET NULL
+                );
+                CREATE TABLE IF NOT EXISTS main.comment (
+                    "id"            INTEGER NOT NULL PRIMARY KEY,
+                    "text"          TEXT,
+                    "author_id"     INTEGER,
+                    "post_id"       INTEGER,
+                    FOREIGN KEY("post_id") REFERENCES "post"("id") 
+                                           ON DELETE SET NULL,
+                    FOREIGN KEY("author_id") REFERENCES "users"("id") 
+                                             ON DELETE SET NULL
+                )
+            """),
+            Migration("create indexes", indexes=(
+                "users_login_idx", "comment_author_idx", "comment_post_idx"
+            )),
+            Migration("count comments of posts", script="""
+                ALTER TABLE main.post 
+                ADD COLUMN "comments_count" INTEGER NOT NULL DEFAULT 0;
+                CREATE TRIGGER main.comment_insert_count_trg 
+                AFTER INSERT ON comment 
+                BEGIN
+                    UPDATE post SET comments_count = comments_count + 1 
+                    WHERE id = NEW.post_id;
+                END;
+                CREATE TRIGGER main.comment_delete_count_trg 
+                AFTER DELETE ON comment 
+                BEGIN
+                    UPDATE post SET comments_count = comments_count - 1 
+                    WHERE id = OLD.post_id;
+                END;
+                CREATE TRIGGER main.comment_update_count_trg 
+                AFTER UPDATE OF post_id ON comment 
+                WHEN OLD.post_id IS NOT NEW.post_id
+                BEGIN
+                    UPDATE post SET comments_count = comments_count - 1 
+                    WHERE id = OLD.post_id;
+                    UPDATE post SET comments_count = comments_count + 1 
+                    WHERE id = NEW.post_id;
+                END
+            """),
+            Migration("backfill comments count", 
+                table="main.post", 
+                backfill="""
+                UPDATE main.post 
+                SET comments_count = (
+                    SELECT count(*) FROM main.comment AS cmt 
+                    WHERE cmt.post_id = post.id
+                ) 
+                WHERE id >= :start AND id < :stop
+            """),
+        ),
+        "logging": (
+            Migration("create tables", script="""
+                CREATE TABLE IF NOT EXISTS logging.event_type (
+                    "id"            INTEGER NOT NULL PRIMARY KEY,
+                    "name"          TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS logging.space_type (
+                    "id"            INTEGER NOT NULL PRIMARY KEY,
+                    "name"          TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS logging.logs (
+                    "id"            INTEGER NOT NULL PRIMARY KEY,
+                    "datetime"      TEXT NOT NULL,
+                    "user_id"       INTEGER,
+                    "space_type_id" INTEGER,
+                    "event_type_id" INTEGER,
+                    FOREIGN KEY("event_type_id") REFERENCES "event_type"("id") 
+                                                 ON DELETE SET NULL,
+                    FOREIGN KEY("space_type_id") REFERENCES "space_type"("id") 
+                                                 ON DELETE SET NULL
+                );
+                INSERT OR IGNORE INTO logging.event_type (id, name) 
+                VALUES 
+                    (1, "login"), 
+                    (2, "comment"), 
+                    (3, "create_post"), 
+                    (4, "delete_post"), 
+                    (5, "logout");
+                INSERT OR IGNORE INTO logging.space_type (id, name) 
+                VALUES (1, "global"), (2, "blog"), (3, "post")
+            """),
+            Migration("add integer timestamps of logs", script="""
+                ALTER TABLE logging.logs ADD COLUMN "ts" INTEGER
+            """),
+            Migration("backfill integer timestamps of logs", 
+                table="logging.logs", 
+                backfill="""
+                UPDATE logging.logs 
+                SET ts = CAST(strftime('%s', datetime) AS INTEGER) 
+                WHERE id >= :start AND id < :stop AND ts IS NULL
+            """),
+            Migration("index and maintain integer timestamps of logs", 
+                script="""
+                CREATE TRIGGER logging.logs_insert_ts_trg 
+                AFTER INSERT ON logs 
+                WHEN NEW.ts IS NULL
+                BEGIN
+                    UPDATE logs 
+                    SET ts = CAST(strftime('%s', NEW.datetime) AS INTEGER) 
+                    WHERE id = NEW.id;
+                END;
+                CREATE TRIGGER logging.logs_update_ts_trg 
+                AFTER UPDATE OF datetime ON logs 
+                WHEN NEW.datetime IS NOT OLD.datetime
+                BEGIN
+                    UPDATE logs 
+                    SET ts = CAST(strftime('%s', NEW.datetime) AS INTEGER) 
+                    WHERE id = NEW.id;
+                END
+                """, 
+                indexes=("logs_user_ts_idx",)
+            ),
+            Migration("roll up daily activity of users", script="""
+                CREATE TABLE logging.user_daily_activity (
+                    "user_id"       INTEGER NOT NULL,
+                    "day"           INTEGER NOT NULL,
+                    "logins"        INTEGER NOT NULL,
+                    "logouts"       INTEGER NOT NULL,
+                    "actions"       INTEGER NOT NULL,
+                    "events"        INTEGER NOT NULL,
+                    PRIMARY KEY("user_id", "day")
+                ) WITHOUT ROWID;
+                CREATE TRIGGER logging.logs_insert_activity_trg 
+                AFTER INSERT ON logs 
+                WHEN NEW.user_id IS NOT NULL AND NEW.ts IS NOT NULL
+                BEGIN
+                    INSERT INTO user_daily_activity 
+                    VALUES (
+                        NEW.user_id, 
+                        NEW.ts / 86400, 
+                        NEW.event_type_id IS 1, 
+                        NEW.event_type_id IS 5, 
+                        coalesce(NEW.space_type_id > 1, 0), 
+                        1
+                    )
+                    ON CONFLICT DO UPDATE SET 
+                        logins = logins + excluded.logins, 
+                        logouts = logouts + excluded.logouts, 
+                        actions = actions + excluded.actions, 
+                        events = events + 1;
+                END;
+                CREATE TRIGGER logging.logs_delete_activity_trg 
+                AFTER DELETE ON logs 
+                WHEN OLD.user_id IS NOT NULL
+                BEGIN
+                    UPDATE user_daily_activity SET 
+                        logins = logins - (OLD.event_type_id IS 1), 
+                        logouts = logouts - (OLD.event_type_id IS 5), 
+                        actions = actions 
+                                  - coalesce(OLD.space_type_id > 1, 0), 
+                        events = events - 1
+                    WHERE user_id = OLD.user_id 
+                      AND day = OLD.ts / 86400;
+                    DELETE FROM user_daily_activity 
+                    WHERE user_id = OLD.user_id 
+                      AND day = OLD.ts / 86400 
+                      AND events = 0;
+                END;
+                CREATE TRIGGER logging.logs_update_activity_trg 
+                AFTER UPDATE OF 
+                    ts, user_id, space_type_id, event_type_id 
+                ON logs 
+                BEGIN
+                    UPDATE user_daily_activity SET 
+                        logins = logins - (OLD.event_type_id IS 1), 
+                        logouts = logouts - (OLD.event_type_id IS 5), 
+                        actions = actions 
+                                  - coalesce(OLD.space_type_id > 1, 0), 
+                        events = events - 1
+                    WHERE user_id = OLD.user_id 
+                      AND day = OLD.ts / 86400;
+                    DELETE FROM user_daily_activity 
+                    WHERE user_id = OLD.user_id 
+                      AND day = OLD.ts / 86400 
+                      AND events = 0;
+                    INSERT INTO user_daily_activity 
+                    SELECT 
+                        NEW.user_id, 
+                        NEW.ts / 86400, 
+                        NEW.event_type_id IS 1, 
+                        NEW.event_type_id IS 5, 
+                        coalesce(NEW.space_type_id > 1, 0), 
+                        1
+                    WHERE NEW.user_id IS NOT NULL AND NEW.ts IS NOT NULL
+                    ON CONFLICT DO UPDATE SET 
+                        logins = logins + excluded.logins, 
+                        logouts = logouts + excluded.logouts, 
+                        actions = actions + excluded.actions, 
+                        events = events + 1;
+                END
+            """),
+            Migration("backfill daily activity of users", 
+                table="logging.logs", 
+                key="user_id", 
+                backfill="""
+                INSERT OR REPLACE INTO logging.user_daily_activity 
+                SELECT 
+                    user_id, 
+                    ts / 86400 AS day, 
+                    count(CASE WHEN event_type_id == 1 THEN 1 END), 
+                    count(CASE WHEN event_type_id == 5 THEN 1 END), 
+                    count(CASE WHEN space_type_id > 1 THEN 1 END), 
+                    count(*)
+                FROM logging.logs 
+                WHERE user_id >= :start AND user_id < :stop 
+                GROUP BY user_id, day
+            """),
+        ),
+    }
+
+    QUERIES = {
+        "login_ids": """
+            SELECT id FROM main.users WHERE login = ? ORDER BY id
+        """,
+        "user_comments": """
+            SELECT 
+                :login AS Login,
+                pst.header AS Header,
+                (
+                    SELECT usr_in.login 
+                    FROM main.users AS usr_in 
+                    WHERE usr_in.id == pst.author_id
+                ) AS Author,
+                pst.comments_count AS Count
+            FROM
+                main.comment AS cmt
+                JOIN main.post AS pst ON cmt.post_id = pst.id
+            WHERE 
+                cmt.author_id IN (SELECT value FROM json_each(:user_ids))
+        """,
+        "user_actions": """
+            SELECT
+                date(act.day * 86400, 'unixepoch') AS Date,
+                sum(act.logins) AS Logins,
+                sum(act.logouts) AS Logouts,
+                sum(act.actions) AS Actions
+            FROM logging.user_daily_activity AS act
+            WHERE 
+                act.user_id IN (SELECT value FROM json_each(:user_ids))
+                AND act.day BETWEEN :since AND :until
+            GROUP BY act.day
+            ORDER BY act.day
+        """,
+        "create_logins": """
+            CREATE TEMP TABLE IF NOT EXISTS report_logins (
+                "login"         TEXT NOT NULL PRIMARY KEY
+            ) WITHOUT ROWID
+        """,
+        "clear_logins": "DELETE FROM temp.report_logins",
+        "insert_login": "INSERT OR IGNORE INTO temp.report_logins VALUES (?)",
+        "count_logins": "SELECT count(*) FROM temp.report_logins",
+        "users_comments": """
+            SELECT 
+                usr.login AS Login,
+                pst.header AS Header,
+                (
+                    SELECT usr_in.login 
+                    FROM main.users AS usr_in 
+                    WHERE usr_in.id == pst.author_id
+                ) AS Author,
+                pst.comments_count AS Count
+            FROM
+                temp.report_logins AS lgn
+                CROSS JOIN main.users AS usr ON usr.login = lgn.login
+                CROSS JOIN main.comment AS cmt ON cmt.author_id = usr.id
+                CROSS JOIN main.post AS pst ON cmt.post_id = pst.id
+        """,
+        "users_actions": """
+            SELECT
+                lgn.login AS Login,
+                date(act.day * 86400, 'unixepoch') AS Date,
+                sum(act.logins) AS Logins,
+                sum(act.logouts) AS Logouts,
+                sum(act.actions) AS Actions
+            FROM
+                temp.report_logins AS lgn
+                CROSS JOIN main.users AS usr ON usr.login = lgn.login
+                CROSS JOIN logging.user_daily_activity AS act 
+                    ON act.user_id = usr.id 
+                    AND act.day BETWEEN :since AND :until
+            GROUP BY lgn.login, act.day
+            ORDER BY lgn.login, act.day
+        """,
+        "all_users_comments": """
+            SELECT 
+                cmt.author_id AS UserID,
+                usr.login AS Login,
+                pst.header AS Header,
+                (
+                    SELECT usr_in.login 
+                    FROM main.users AS usr_in 
+                    WHERE usr_in.id == pst.author_id
+                ) AS Author,
+                pst.comments_count AS Count
+            FROM
+                main.comment AS cmt
+                JOIN main.users AS usr ON cmt.author_id = usr.id
+                JOIN main.post AS pst ON cmt.post_id = pst.id
+            ORDER BY cmt.author_id
+        """,
+        "all_users_actions": """
+            SELECT
+                act.user_id AS UserID,
+                date(act.day * 86400, 'unixepoch') AS Date,
+                act.logins AS Logins,
+                act.logouts AS Logouts,
+                act.actions AS Actions
+            FROM logging.user_daily_activity AS act
+            WHERE act.day BETWEEN :since AND :until
+            ORDER BY act.user_id, act.day
+        """,
+    }
+
+    LOGIN_CACHE_SIZE = 4096
+
+    FETCH_SIZE = 10000
+
+    def __init__(self, 
+            main_db_location: str, 
+            logging_db_location: str,
+            chunk_size: int = 10000,
+            generator: str = "auto",
+            workers: int = 1,
+            seed: int | None = None,
+            now: datetime.datetime | None = None,
+            cached_statements: int = 128
+    ):
         """
         Initializes a DBInterface object with the specified database locations.
 
         Args:
             main_db_location    (str): The location of the main database.
             logging_db_location (str): The location of the logging database.
+            chunk_size          (int): The number of rows inserted per 
+                                       transaction by fill methods. 
+                                       Defaults to 10000.
+            generator           (str): The generator mode of random data, 
+                                       one of misc.GENERATOR_MODES. 
+                                       Defaults to "auto".
+            workers             (int): The number of processes generating 
+                                       rows for fill methods, while the 
+                                       calling process writes them. 
+                                       Defaults to 1.
+            seed                (int | None): The seed making generated 
+                                              data reproducible for the 
+                                              same chunk size. Defaults 
+                                              to None, unseeded.
+            now                 (datetime.datetime | None): The moment 
+                                    relative dates of generated data are 
+                                    counted from. Defaults to the current 
+                                    date and time, or to 
+                                    misc.REFERENCE_DATE if seed is given.
+            cached_statements   (int): The number of prepared statements 
+                                       kept by the connection, so repeated 
+                                       queries are not parsed and planned 
+                                       again. Defaults to 128.
         """
         
         self.main_db_location = main_db_location
         self.logging_db_location = logging_db_location
+        self.cached_statements = cached_statements
+        self.chunk_size = max(1, chunk_size)
+        self.generator = generator
+        self.workers = max(1, workers)
+        self.random = random.Random(seed)
+        self.provider = misc.get_provider(generator)
+
+        if now is None and seed is not None:
+            now = misc.REFERENCE_DATE
+
+        self.provider.now = now
 
         self.connection = None 
         self.cursor = None
 
+        self.id_cache = {}
+        self.login_cache = collections.OrderedDict()
+        self.data_version = None
+        self.bulk_load_state = None
+
 
-    def connect(self) -> None:
+    def connect(self, read_only: bool = False) -> None:
         """
         Establishes connection to the main and logging databases.
+
+        A read-only connection opens existing databases only and may be 
+        used next to other connections to run reports concurrently. As 
+        every connection is bound to the thread it was opened in, each 
+        thread connects its own DBInterface.
+
+        Args:
+            read_only (bool): If True, opens both databases read-only. 
+                              Defaults to False.
         """
 
-        self.connection = sqlite3.connect(self.main_db_location)
+        main_db_location = self.main_db_location
+        logging_db_location = self.logging_db_location
+
+        if read_only:
+            main_db_location, logging_db_location = (
+                pathlib.Path(location).resolve().as_uri() + "?mode=ro"
+                for location in (main_db_location, logging_db_location)
+            )
+
+        self.connection = sqlite3.connect(
+            main_db_location, 
+            cached_statements=self.cached_statements,
+            uri=read_only
+        )
         self.cursor = self.connection.cursor()
         self.cursor.execute(
-            f"ATTACH DATABASE '{self.logging_db_location}' AS logging"
+            "ATTACH DATABASE ? AS logging", (logging_db_location,)
         )
 
 
@@ -90,93 +690,522 @@ class DBInterface:
         self.cursor.execute("DETACH logging")
         self.connection.close()
 
+
+    def begin_bulk_load(self) -> None:
+        """
+        Switches both databases to bulk-load mode.
+
+        Settings of both schemas are switched to BULK_LOAD_PRAGMAS, which 
+        keep the rollback journal in memory and skip fsync calls, so a 
+        crash during bulk-load may corrupt the databases. Secondary indexes 
+        and triggers are dropped to be rebuilt once by end_bulk_load() 
+        instead of being updated or fired on every inserted row. Their SQL 
+        is saved in the bulk_load_objects table of each database, and the 
+        largest IDs of the tables of BULK_LOAD_REFRESHES in its 
+        bulk_load_marks table, in the same transaction. A bulk load 
+        interrupted before end_bulk_load() is finished by the next 
+        migrate(), ensure_indexes() or begin_bulk_load().
+
+        Raises:
+            RuntimeError: If a database has pending migrations, as the data 
+                          maintained by triggers is recomputed for the 
+                          latest schema only.
+        """
+
+        if self.bulk_load_state is not None:
+            return
+
+        self.connection.commit()
+        self.__finish_bulk_load__()
+
+        for schema in self.SCHEMAS:
+            self.cursor.execute(f"PRAGMA {schema}.user_version")
+            if self.cursor.fetchone()[0] != len(self.MIGRATIONS[schema]):
+                raise RuntimeError(
+                    f"The {schema} database must be migrated before bulk load"
+                )
+
+        with self.connection:
+            self.cursor.execute("BEGIN")
+
+            for schema in self.SCHEMAS:
+                self.cursor.execute(f"""
+                    CREATE TABLE {schema}.bulk_load_objects (
+                        "sql"           TEXT NOT NULL
+                    )
+                """)
+                self.cursor.execute(f"""
+                    CREATE TABLE {schema}.bulk_load_marks (
+                        "source"        TEXT NOT NULL PRIMARY KEY,
+                        "mark"          INTEGER NOT NULL
+                    ) WITHOUT ROWID
+                """)
+                self.cursor.execute(f"""
+                    SELECT type, name, sql FROM {schema}.sqlite_master 
+                    WHERE type IN ('index', 'trigger') AND sql IS NOT NULL
+                """)
+
+                for object_type, name, sql in self.cursor.fetchall():
+                    self.cursor.execute(
+                        f"INSERT INTO {schema}.bulk_load_objects VALUES (?)", 
+                        (re.sub(
+                            r"^(CREATE (UNIQUE )?(INDEX|TRIGGER) )", 
+                            rf"\1{schema}.", sql
+                        ),)
+                    )
+                    self.cursor.execute(
+                        f'DROP {object_type} {schema}."{name}"'
+                    )
+
+            for source in self.BULK_LOAD_REFRESHES:
+                schema = source.split(".")[0]
+                self.cursor.execute(f"""
+                    INSERT INTO {schema}.bulk_load_marks 
+                    SELECT ?, coalesce(max(id), 0) FROM {source}
+                """, (source,))
+
+        state = {"pragmas": {}}
+
+        for schema in self.SCHEMAS:
+            for pragma, value in self.BULK_LOAD_PRAGMAS.items():
+                name = f"{schema}.{pragma}"
+                self.cursor.execute(f"PRAGMA {name}")
+                state["pragmas"][name] = self.cursor.fetchone()[0]
+                self.cursor.execute(f"PRAGMA {name} = {value}")
+
+        self.cursor.execute("PRAGMA temp_store")
+        state["pragmas"]["temp_store"] = self.cursor.fetchone()[0]
+        self.cursor.execute("PRAGMA temp_store = MEMORY")
+
+        self.bulk_load_state = state
+
+
+    def end_bulk_load(self) -> None:
+        """
+        Rebuilds indexes and restores safe settings after bulk-load mode.
+
+        Indexes and triggers dropped by begin_bulk_load() are created 
+        again, and the data they would have maintained is recomputed for 
+        the rows inserted in bulk-load mode. Then statistics of both 
+        schemas are gathered with ANALYZE, and the saved settings are 
+        restored.
+        """
+
+        if self.bulk_load_state is None:
+            return
+
+        self.connection.commit()
+        self.__finish_bulk_load__()
+
+        for schema in self.SCHEMAS:
+            self.cursor.execute(f"ANALYZE {schema}")
+
+        for name, value in self.bulk_load_state["pragmas"].items():
+            self.cursor.execute(f"PRAGMA {name} = {value}")
+
+        self.bulk_load_state = None
+
+
+    def __finish_bulk_load__(self) -> None:
+        """
+        Finishes a bulk load, also one interrupted in an earlier run.
+
+        Indexes and triggers saved in the bulk_load_objects tables are 
+        created again in a single transaction. Then the queries of 
+        BULK_LOAD_REFRESHES recompute the data the triggers would have 
+        maintained, only for the rows with IDs above the marks saved in the 
+        bulk_load_marks tables. The marks are dropped after the queries, 
+        so the queries are run again if interrupted.
+        """
+
+        self.cursor.execute("""
+            SELECT 'main', name FROM main.sqlite_master 
+            WHERE name IN ('bulk_load_objects', 'bulk_load_marks') 
+            UNION ALL 
+            SELECT 'logging', name FROM logging.sqlite_master 
+            WHERE name IN ('bulk_load_objects', 'bulk_load_marks')
+        """)
+        tables = self.cursor.fetchall()
+
+        if not tables:
+            return
+
+        with self.connection:
+            self.cursor.execute("BEGIN")
+
+            for schema, name in tables:
+                if name != "bulk_load_objects":
+                    continue
+
+                self.cursor.execute(
+                    f"SELECT sql FROM {schema}.bulk_load_objects"
+                )
+                for (sql,) in self.cursor.fetchall():
+                    self.cursor.execute(sql)
+
+                self.cursor.execute(f"DROP TABLE {schema}.bulk_load_objects")
+
+        for schema, name in tables:
+            if name != "bulk_load_marks":
+                continue
+
+            self.cursor.execute(
+                f"SELECT source, mark FROM {schema}.bulk_load_marks"
+            )
+
+            for source, mark in self.cursor.fetchall():
+                with self.connection:
+                    self.cursor.execute(
+                        self.BULK_LOAD_REFRESHES[source], {"mark": mark}
+                    )
+
+            self.cursor.execute(f"DROP TABLE {schema}.bulk_load_marks")
+
     
-    def create_tables(self) -> None:
+    def create_tables(self) -> list[tuple[str, int, str, float]]:
         """
         Creates tables in the main and logging databases in specialized schema.
+
+        Tables are created by applying pending migrations, so the method 
+        also upgrades databases created by earlier versions.
+
+        Returns:
+            list[tuple[str, int, str, float]]: The applied migrations, as 
+                                               returned by migrate().
         """
 
-        query = """
-            CREATE TABLE main.users (
-                "id"            INTEGER NOT NULL PRIMARY KEY,
-                "email"         TEXT,
-                "login"         TEXT NOT NULL
-            );
-            CREATE TABLE main.blog (
-                "id"            INTEGER NOT NULL PRIMARY KEY,
-                "owner_id"      INTEGER,
-                "name"          TEXT NOT NULL,
-                "description"   TEXT,
-                FOREIGN KEY("owner_id") REFERENCES "users"("id") 
-                                        ON DELETE SET NULL
-            );
-            CREATE TABLE main.post (
-                "id"            INTEGER NOT NULL PRIMARY KEY,
-                "header"        TEXT NOT NULL,
-                "text"          TEXT,
-                "author_id"     INTEGER,
-                "blog_id"       INTEGER,
-                FOREIGN KEY("blog_id") REFERENCES "blog"("id") 
-                                       ON DELETE SET NULL,
-                FOREIGN KEY("author_id") REFERENCES "users"("id") 
-                                         ON DELETE SET NULL
-            );
-            CREATE TABLE main.comment (
-                "id"            INTEGER NOT NULL PRIMARY KEY,
-                "text"          TEXT,
-                "author_id"     INTEGER,
-                "post_id"       INTEGER,
-                FOREIGN KEY("post_id") REFERENCES "post"("id") 
-                                       ON DELETE SET NULL,
-                FOREIGN KEY("author_id") REFERENCES "users"("id") 
-                                         ON DELETE SET NULL
-            );
-            CREATE TABLE logging.event_type (
-                "id"            INTEGER NOT NULL PRIMARY KEY,
-                "name"          TEXT NOT NULL
-            );
-            CREATE TABLE logging.space_type (
-                "id"            INTEGER NOT NULL PRIMARY KEY,
-                "name"          TEXT NOT NULL
-            );
-            CREATE TABLE logging.logs (
-                "id"            INTEGER NOT NULL PRIMARY KEY,
-                "datetime"      TEXT NOT NULL,
-                "user_id"       INTEGER,
-                "space_type_id" INTEGER,
-                "event_type_id" INTEGER,
-                FOREIGN KEY("event_type_id") REFERENCES "event_type"("id") 
-                                             ON DELETE SET NULL,
-                FOREIGN KEY("space_type_id") REFERENCES "space_type"("id") 
-                                             ON DELETE SET NULL
-            );
-            INSERT INTO logging.event_type (name) 
-            VALUES 
-                ("login"), 
-                ("comment"), 
-                ("create_post"), 
-                ("delete_post"), 
-                ("logout");
-            INSERT INTO logging.space_type (name) 
-            VALUES ("global"), ("blog"), ("post");
+        return self.migrate()
+
+
+    def migrate(self) -> list[tuple[str, int, str, float]]:
+        """
+        Applies pending migrations to the main and logging databases.
+
+        The version of every database is kept in its PRAGMA user_version 
+        and equals the number of migrations from MIGRATIONS applied to it. 
+        A migration with a script is applied in a single transaction 
+        together with the version change, so it is either applied entirely 
+        or not at all. A backfill migration commits every chunk on its own 
+        and changes the version after the last one, so it is run again 
+        from the start if interrupted.
+        An interrupted bulk load is finished before any migration.
+
+        Returns:
+            list[tuple[str, int, str, float]]: The schema, the version, the 
+                                               description and the duration 
+                                               in seconds of every applied 
+                                               migration.
+        """
+
+        if self.bulk_load_state is None:
+            self.__finish_bulk_load__()
+
+        report = []
+
+        for schema in self.SCHEMAS:
+            self.cursor.execute(f"PRAGMA {schema}.user_version")
+            current = self.cursor.fetchone()[0]
+
+            for version, migration in enumerate(
+                    self.MIGRATIONS[schema], start=1
+            ):
+                if version <= current:
+                    continue
+
+                started = time.perf_counter()
+                self.__apply_migration__(schema, version, migration)
+                report.append((
+                    schema, version, migration.description, 
+                    time.perf_counter() - started
+                ))
+
+        return report
+
+
+    def __apply_migration__(self, 
+            schema: str, 
+            version: int, 
+            migration: Migration
+    ) -> None:
+        """
+        Applies a migration and sets the version of its database.
+
+        Args:
+            schema    (str): The name of the database to migrate.
+            version   (int): The version of the database after migration.
+            migration (Migration): The migration to apply.
+        """
+
+        set_version = f"PRAGMA {schema}.user_version = {version};"
+
+        if migration.backfill is None:
+            script = ";".join(
+                [migration.script or ""] 
+                + [self.__index_sql__(name) for name in migration.indexes]
+            )
+
+            try:
+                self.connection.executescript(
+                    f"BEGIN; {script}; {set_version} COMMIT;"
+                )
+            except sqlite3.Error:
+                if self.connection.in_transaction:
+                    self.connection.rollback()
+                raise
+            return
+
+        self.__backfill__(migration)
+        self.cursor.execute(set_version)
+
+
+    def __backfill__(self, migration: Migration) -> None:
+        """
+        Runs the backfill query of a migration over its table by chunks.
+
+        Args:
+            migration (Migration): The backfill migration to run.
+        """
+
+        key = migration.key
+        self.cursor.execute(
+            f"SELECT min({key}), max({key}) FROM {migration.table}"
+        )
+        low, high = self.cursor.fetchone()
+
+        if low is None:
+            return
+
+        for start in range(low, high+1, self.chunk_size):
+            with self.connection:
+                self.cursor.execute(migration.backfill, {
+                    "start": start, 
+                    "stop": start + self.chunk_size
+                })
+
+
+    def ensure_indexes(self) -> None:
+        """
+        Creates the secondary indexes declared in INDEXES.
+
+        Indexes which already exist are left untouched, so the method is 
+        safe to run against existing databases at any time. Indexes on 
+        columns a database does not have yet are skipped, as they are 
+        created by the migration adding the columns. Indexes and triggers 
+        of an interrupted bulk load are restored first.
+        """
+
+        if self.bulk_load_state is None:
+            self.__finish_bulk_load__()
+
+        with self.connection:
+            for name, (schema, table, columns) in self.INDEXES.items():
+                self.cursor.execute(f"PRAGMA {schema}.table_info({table})")
+                existing = {row[1] for row in self.cursor.fetchall()}
+
+                if existing.issuperset(columns):
+                    self.cursor.execute(self.__index_sql__(name))
+
+
+    def __index_sql__(self, name: str) -> str:
+        """
+        Builds the statement creating an index declared in INDEXES.
+
+        Args:
+            name (str): The name of the index.
+
+        Returns:
+            str: The CREATE INDEX IF NOT EXISTS statement of the index.
+        """
+
+        schema, table, columns = self.INDEXES[name]
+
+        return f"""
+            CREATE INDEX IF NOT EXISTS {schema}.{name} 
+            ON {table} ({", ".join(columns)})
+        """
+
+
+    def clear_id_cache(self) -> None:
+        """
+        Forgets the cached IDs of tables and users.
+
+        Writes of other connections are detected automatically, so this is 
+        needed only after rows are deleted or logins are changed through 
+        this connection.
+        """
+
+        self.id_cache.clear()
+        self.login_cache.clear()
+        self.data_version = None
+
+
+    def resolve_login(self, login: str) -> tuple[int, ...]:
         """
+        Retrieves the IDs of users with a login.
 
-        self.connection.executescript(query)
+        Logins are looked up in the users_login_idx index and kept in the 
+        login cache, which drops the least recently used login once it 
+        holds LOGIN_CACHE_SIZE logins. Like the id cache, it is dropped 
+        when another connection commits to the main database, and users 
+        inserted by fill_users() clear it.
 
+        Args:
+            login (str): The login of the users.
 
-    def __get_all_ids__(self, table_name: str = "main.users") -> list[int]:
+        Returns:
+            tuple[int, ...]: The ascending IDs of the users, empty if no 
+                             user has the login.
+        """
+
+        self.__check_data_version__()
+
+        user_ids = self.login_cache.get(login)
+
+        if user_ids is None:
+            self.cursor.execute(self.QUERIES["login_ids"], (login,))
+            user_ids = tuple(row[0] for row in self.cursor.fetchall())
+
+            self.login_cache[login] = user_ids
+            if len(self.login_cache) > self.LOGIN_CACHE_SIZE:
+                self.login_cache.popitem(last=False)
+        else:
+            self.login_cache.move_to_end(login)
+
+        return user_ids
+
+
+    def __check_data_version__(self) -> None:
+        """
+        Drops the id and login caches if another connection has committed 
+        to the main database since they were filled.
+        """
+
+        self.cursor.execute("PRAGMA main.data_version")
+        data_version = self.cursor.fetchone()[0]
+
+        if data_version != self.data_version:
+            self.id_cache.clear()
+            self.login_cache.clear()
+            self.data_version = data_version
+
+
+    def __get_all_ids__(
+            self, 
+            table_name: str = "main.users"
+    ) -> range | array.array:
         """
         Retrieves all IDs from the specified table.
 
+        IDs are read from the database once and then served from the id 
+        cache. The cache is dropped when another connection commits to the 
+        main database, as reported by its data version.
+
         Args:
             table_name (str): The name of the table from which to retrieve IDs.
 
         Returns:
-            list[int]: A list of all IDs from the specified table.
+            range | array.array: The ascending IDs from the specified table, 
+                                 as a range if they are contiguous.
+        """
+
+        self.__check_data_version__()
+
+        if table_name not in self.id_cache:
+            self.id_cache[table_name] = sampling.read_ids(
+                self.cursor, table_name
+            )
+
+        return self.id_cache[table_name]
+
+
+    def __update_ids__(self, table_name: str) -> None:
+        """
+        Appends IDs of rows inserted since the last read to the id cache.
+
+        Args:
+            table_name (str): The name of the table which rows were inserted.
+        """
+
+        ids = self.id_cache.get(table_name)
+        if ids is None:
+            return
+
+        new_ids = sampling.read_ids(
+            self.cursor, table_name, ids[-1] if ids else 0
+        )
+        self.id_cache[table_name] = sampling.merge_ids(ids, new_ids)
+
+
+    def __chunk_sizes__(self, count: int) -> Iterator[int]:
+        """
+        Splits the number of rows to insert into chunks.
+
+        Args:
+            count (int): The total number of rows to insert.
+
+        Yields:
+            int: The number of rows in the next chunk, at most chunk_size.
+        """
+
+        for start in range(0, count, self.chunk_size):
+            yield min(self.chunk_size, count - start)
+
+
+    def __insert_chunk__(self, batches: dict[str, list[list]]) -> None:
+        """
+        Inserts one chunk of rows within a single transaction.
+
+        Every query is a prepared statement executed once per row of its 
+        batch, so generated values are bound as parameters and never 
+        spliced into SQL text. Rows are encoded from the columns while 
+        they are being bound.
+
+        Args:
+            batches (dict[str, list[list]]): The mapping of parameterized 
+                                             insert queries to the columns 
+                                             of rows bound to them.
+        """
+
+        with self.connection:
+            for query, columns in batches.items():
+                self.cursor.executemany(
+                    query, generation.encode_rows(columns)
+                )
+
+
+    def __fill__(self, 
+            kind: str, 
+            queries: tuple[str, ...], 
+            chunks_args: Iterable[tuple], 
+            context: dict
+    ) -> None:
+        """
+        Generates chunks of dummy rows and inserts them chunk by chunk.
+
+        Every chunk gets its own seed, so chunks generated by worker 
+        processes use independent random streams, and a seeded instance 
+        generates the same rows whatever the number of workers is.
+
+        Args:
+            kind        (str): The kind of chunks, a key of 
+                               generation.GENERATORS.
+            queries     (tuple[str, ...]): The insert queries, one for 
+                                           every table of a chunk.
+            chunks_args (Iterable[tuple]): The generator arguments of 
+                                           every chunk.
+            context     (dict): The referenced ids.
         """
 
-        self.cursor.execute(f"SELECT id FROM {table_name}")
-        return [pair[0] for pair in self.cursor.fetchall()]
+        tasks = (
+            (kind, self.random.getrandbits(64), args) 
+            for args in chunks_args
+        )
+
+        for chunk in generation.generate_chunks(
+                tasks, self.generator, context, 
+                self.workers, self.provider.now
+        ):
+            self.__insert_chunk__(dict(zip(queries, chunk)))
 
 
     def fill_users(self, count: int = 1) -> None:
@@ -187,16 +1216,15 @@ class DBInterface:
             count (int): The number of dummy users to insert.
         """
 
-        logins = [misc.get_name() for _ in range(count)]
-        emails = [
-            name.lower().replace(" ", "_")+"@example.com" 
-            for name in logins
-        ]
-        
-        values = ", ".join([str(pair) for pair in zip(emails, logins)])
-        query = f"INSERT INTO main.users (email, login) VALUES {values};"
+        query = "INSERT INTO main.users (email, login) VALUES (?, ?);"
 
-        self.cursor.execute(query)
+        self.__fill__(
+            "users", (query,), 
+            ((size,) for size in self.__chunk_sizes__(count)), 
+            {}
+        )
+        self.__update_ids__("main.users")
+        self.login_cache.clear()
     
 
     def fill_blogs(self, count: int = 1) -> None:
@@ -207,19 +1235,19 @@ class DBInterface:
             count (int): The number of dummy blogs to insert.
         """
 
-        user_ids = self.__get_all_ids__("main.users")
-        
-        values = ", ".join([
-            f"({random.choice(user_ids)}, '{misc.get_sentence()}', \
-                '{misc.get_description()}')" 
-            for _ in range(count)
-        ])
+        context = {"user_ids": self.__get_all_ids__("main.users")}
 
-        query = f"""
-            INSERT INTO main.blog (owner_id, name, description) VALUES {values};
+        query = """
+            INSERT INTO main.blog (owner_id, name, description) 
+            VALUES (?, ?, ?);
         """
 
-        self.cursor.execute(query)
+        self.__fill__(
+            "blogs", (query,), 
+            ((size,) for size in self.__chunk_sizes__(count)), 
+            context
+        )
+        self.__update_ids__("main.blog")
 
 
     def fill_posts(self, count: int = 1) -> None:
@@ -230,46 +1258,28 @@ class DBInterface:
             count (int): The number of dummy posts to insert.
         """
 
-        user_ids = self.__get_all_ids__("main.users")
-        blog_ids = self.__get_all_ids__("main.blog")
-
-        values_main_lst = []
-        values_logging_lst = []
-        
-        for _ in range(count):
-            user_id = random.choice(user_ids)
-            blog_id = random.choice(blog_ids)
-
-            values_main_lst.append(
-                f"('{misc.get_sentence()}', '{misc.get_description()}', \
-                    {user_id}, {blog_id})"
-            )
-            values_logging_lst.append(
-                f"('{misc.get_random_date('-2d', 'now')}', {user_id}, 2, 3)"
-            )
-
-            if random.randint(0, 3) == 1:
-                #Randomly remove post
-                values_logging_lst.append(
-                    f"('{misc.get_random_date('+1d', '+4d')}', {user_id}, 2, 4)"
-                )
-
-        values_main = ", ".join(values_main_lst)
-        values_logging = ", ".join(values_logging_lst)
+        context = {
+            "user_ids": self.__get_all_ids__("main.users"),
+            "blog_ids": self.__get_all_ids__("main.blog")
+        }
 
-        query_main = f"""
+        query_main = """
             INSERT INTO main.post (header, text, author_id, blog_id) 
-            VALUES {values_main};
+            VALUES (?, ?, ?, ?);
         """
 
-        query_logging = f"""
+        query_logging = """
             INSERT INTO logging.logs 
-            (datetime, user_id, space_type_id, event_type_id) 
-            VALUES {values_logging};
+            (datetime, ts, user_id, space_type_id, event_type_id) 
+            VALUES (?, ?, ?, ?, ?);
         """
 
-        self.cursor.execute(query_main)
-        self.cursor.execute(query_logging)
+        self.__fill__(
+            "posts", (query_main, query_logging), 
+            ((size,) for size in self.__chunk_sizes__(count)), 
+            context
+        )
+        self.__update_ids__("main.post")
 
     
     def fill_comments(self, count: int = 1) -> None:
@@ -280,40 +1290,27 @@ class DBInterface:
             count (int): The number of dummy comments to insert.
         """
 
-        user_ids = self.__get_all_ids__("main.users")
-        post_ids = self.__get_all_ids__("main.post")
-
-        values_main_lst = []
-        values_logging_lst = []
-
-        for _ in range(count):
-            user_id = random.choice(user_ids)
-            post_id = random.choice(post_ids)
-
-            values_main_lst.append(
-                f"('{misc.get_description()}', {user_id}, {post_id})"
-            )
-            values_logging_lst.append(
-                f"('{misc.get_random_date('now', '+1d')}', \
-                    {random.choice(user_ids)}, 3, 2)"
-            )
-
-        values_main = ", ".join(values_main_lst)
-        values_logging = ", ".join(values_logging_lst)
+        context = {
+            "user_ids": self.__get_all_ids__("main.users"),
+            "post_ids": self.__get_all_ids__("main.post")
+        }
 
-        query_main = f"""
+        query_main = """
             INSERT INTO main.comment (text, author_id, post_id) 
-            VALUES {values_main}
+            VALUES (?, ?, ?);
         """
 
-        query_logging = f"""
+        query_logging = """
             INSERT INTO logging.logs 
-            (datetime, user_id, space_type_id, event_type_id) 
-            VALUES {values_logging};
+            (datetime, ts, user_id, space_type_id, event_type_id) 
+            VALUES (?, ?, ?, ?, ?);
         """
-        
-        self.cursor.execute(query_main)
-        self.cursor.execute(query_logging)
+
+        self.__fill__(
+            "comments", (query_main, query_logging), 
+            ((size,) for size in self.__chunk_sizes__(count)), 
+            context
+        )
 
 
     def fill_logs_login_logout(self, is_login: bool = True) -> None:
@@ -325,86 +1322,296 @@ class DBInterface:
                              inserts logout data.
         """
 
-        user_ids = self.__get_all_ids__("main.users")
-        date_range = [("-5d", "now"), ("now", "+5d")][not is_login]
-        state = 1 if is_login else 5
+        self.__fill_logins__([is_login])
+
+
+    def fill_actions(self, rounds: int = 1) -> None:
+        """
+        Inserts rounds of login and logout data into the logging database.
+
+        Every round inserts a login and then a logout of every user, all 
+        in a single pass over the user IDs.
+
+        Args:
+            rounds (int): The number of login and logout rounds to insert.
+        """
+
+        self.__fill_logins__([True, False] * rounds)
+
+
+    def __fill_logins__(self, states: list[bool]) -> None:
+        """
+        Inserts login or logout data of every user for every given state.
 
-        values = ", ".join([
-            f"('{misc.get_random_date(*date_range)}', {user_id}, 1, {state})"
-            for user_id in user_ids
-        ])
+        Args:
+            states (list[bool]): The sequence of states to insert, True 
+                                 for logins and False for logouts.
+        """
 
-        query = f"""
+        context = {"user_ids": self.__get_all_ids__("main.users")}
+        count = len(context["user_ids"])
+
+        query = """
             INSERT INTO logging.logs 
-            (datetime, user_id, space_type_id, event_type_id) VALUES {values};
+            (datetime, ts, user_id, space_type_id, event_type_id) 
+            VALUES (?, ?, ?, ?, ?);
         """
-       
-        self.cursor.execute(query)
+
+        self.__fill__(
+            "logins", (query,), 
+            (
+                (start, min(start+self.chunk_size, count), is_login) 
+                for is_login in states
+                for start in range(0, count, self.chunk_size)
+            ), 
+            context
+        )
 
     
-    def get_user_comments_info(self, username: str) -> list[tuple]:
+    def get_user_comments_info(self, 
+            username: str,
+            user_ids: tuple[int, ...] | None = None
+    ) -> Iterator[tuple]:
         """
         Retrieves user comments information from the main database.
 
+        Comments of every user with the login are retrieved, with the IDs 
+        of the users taken from resolve_login() unless they are given. 
+        Rows are fetched in batches while they are consumed.
+
         Args:
             username (str): The username of the user whose comments 
                             information to retrieve.
+            user_ids (tuple[int, ...] | None): The IDs of the users with 
+                                               the login, or None to 
+                                               resolve them. Defaults to 
+                                               None.
 
         Returns:
-            list[tuple]: A list of tuples containing user comments information.
+            Iterator[tuple]: The rows containing user comments information.
         """
 
-        query = f"""
-            SELECT 
-                usr.login AS Login,
-                pst.header AS Header,
-                (
-                    SELECT usr_in.login 
-                    FROM main.users AS usr_in 
-                    WHERE usr_in.id == pst.author_id
-                ) AS Author,
-                (
-                    SELECT count(*) 
-                    FROM main.comment AS cmt_in 
-                    WHERE cmt_in.post_id == cmt.post_id
-                ) AS Count
-            FROM
-                main.comment AS cmt
-                JOIN main.users AS usr ON cmt.author_id = usr.id
-                JOIN main.post AS pst ON cmt.post_id = pst.id
-            WHERE 
-                usr.login == "{username}"
-        """
+        if user_ids is None:
+            user_ids = self.resolve_login(username)
 
-        self.cursor.execute(query)
-        return self.cursor.fetchall()
+        return self.__stream__(self.QUERIES["user_comments"], {
+            "login": username,
+            "user_ids": json.dumps(user_ids)
+        })
 
 
-    def get_user_actions_info(self, username: str) -> list[tuple]:
+    def get_user_actions_info(self, 
+            username: str,
+            since: datetime.date | None = None,
+            until: datetime.date | None = None,
+            user_ids: tuple[int, ...] | None = None
+    ) -> Iterator[tuple]:
         """
         Retrieves user actions information from the logging database.
 
+        Actions of every user with the login are summed up by day, with the 
+        IDs of the users taken from resolve_login() unless they are given, 
+        so both reports cover the same users. Rows are fetched in batches 
+        while they are consumed.
+
         Args:
             username (str): The username of the user whose actions 
                             information to retrieve.
+            since    (datetime.date | None): The first day to retrieve, or 
+                                             None for the first day of the 
+                                             history. Defaults to None.
+            until    (datetime.date | None): The last day to retrieve, or 
+                                             None for the last day of the 
+                                             history. Defaults to None.
+            user_ids (tuple[int, ...] | None): The IDs of the users with 
+                                               the login, or None to 
+                                               resolve them. Defaults to 
+                                               None.
 
         Returns:
-            list[tuple]: A list of tuples containing user actions information.
+            Iterator[tuple]: The rows containing user actions information.
         """
 
-        query = f"""
-            SELECT
-                date(lgs.datetime) AS Date,
-                count(CASE WHEN lgs.event_type_id == 1 THEN 1 END) AS Logins,
-                count(CASE WHEN lgs.event_type_id == 5 THEN 1 END) AS Logouts,
-                count(CASE WHEN lgs.space_type_id > 1 THEN 1 END) AS Actions
-            FROM logging.logs AS lgs
-            WHERE lgs.user_id == (
-                SELECT usr.id FROM main.users AS usr 
-                WHERE usr.login == "{username}" LIMIT 1
+        if user_ids is None:
+            user_ids = self.resolve_login(username)
+
+        params = self.__days_params__(since, until)
+        params["user_ids"] = json.dumps(user_ids)
+
+        return self.__stream__(self.QUERIES["user_actions"], params)
+
+
+    def __stream__(
+            self, 
+            query: str, 
+            params: dict | tuple = ()
+    ) -> Iterator[tuple]:
+        """
+        Executes a query on its own cursor and yields its rows in batches.
+
+        Rows are fetched FETCH_SIZE at a time, so reports of any length 
+        hold a single batch in memory, and several reports may be consumed 
+        at once.
+
+        Args:
+            query  (str): The query to execute.
+            params (dict | tuple): The parameters of the query.
+
+        Returns:
+            Iterator[tuple]: The rows of the query.
+        """
+
+        cursor = self.connection.execute(query, params)
+        cursor.arraysize = self.FETCH_SIZE
+
+        return itertools.chain.from_iterable(iter(cursor.fetchmany, []))
+
+
+    def __days_params__(
+            self,
+            since: datetime.date | None = None,
+            until: datetime.date | None = None
+    ) -> dict[str, int]:
+        """
+        Builds the parameters bounding the days of the activity rollup.
+
+        Days of the rollup are numbers of days since the epoch. Missing 
+        bounds are replaced with the smallest and the largest integers, so 
+        the queries keep the same text and their range is still searched 
+        in the primary key of the rollup.
+
+        Args:
+            since (datetime.date | None): The first day of the range, or 
+                                          None for no lower bound.
+            until (datetime.date | None): The last day of the range, or 
+                                          None for no upper bound.
+
+        Returns:
+            dict[str, int]: The :since and :until parameters.
+        """
+
+        epoch = misc.EPOCH.toordinal()
+
+        return {
+            "since": -2**63 if since is None else since.toordinal() - epoch,
+            "until": 2**63 - 1 if until is None else until.toordinal() - epoch
+        }
+
+
+    def load_logins(self, logins: Iterable[str]) -> int:
+        """
+        Loads logins for batch reports into a temporary table.
+
+        The logins replace the ones loaded before. Batch reports join this 
+        table once against the databases instead of running the single 
+        login reports for every login.
+
+        Args:
+            logins (Iterable[str]): The logins to report on. Duplicates are 
+                                    loaded once.
+
+        Returns:
+            int: The number of distinct loaded logins.
+        """
+
+        with self.connection:
+            self.cursor.execute(self.QUERIES["create_logins"])
+            self.cursor.execute(self.QUERIES["clear_logins"])
+            self.cursor.executemany(
+                self.QUERIES["insert_login"], 
+                ((login,) for login in logins)
             )
-            GROUP BY date(lgs.datetime)
+
+        self.cursor.execute(self.QUERIES["count_logins"])
+        return self.cursor.fetchone()[0]
+
+
+    def get_users_comments_info(self) -> Iterator[tuple]:
+        """
+        Retrieves comments information of all logins loaded by 
+        load_logins().
+
+        Rows are fetched lazily while they are consumed, grouped by login. 
+        CROSS JOIN keeps the loaded logins as the outer loop, so the cost 
+        depends on the comments of these logins only.
+
+        Returns:
+            Iterator[tuple]: The rows of get_user_comments_info() of every 
+                             loaded login.
+        """
+
+        return self.__stream__(self.QUERIES["users_comments"])
+
+
+    def get_users_actions_info(self, 
+            since: datetime.date | None = None,
+            until: datetime.date | None = None
+    ) -> Iterator[tuple]:
+        """
+        Retrieves actions information of all logins loaded by 
+        load_logins().
+
+        Rows are fetched lazily while they are consumed, grouped by login.
+
+        Args:
+            since (datetime.date | None): The first day to retrieve, or 
+                                          None for the first day of the 
+                                          history. Defaults to None.
+            until (datetime.date | None): The last day to retrieve, or None 
+                                          for the last day of the history. 
+                                          Defaults to None.
+
+        Returns:
+            Iterator[tuple]: The rows of get_user_actions_info() of every 
+                             loaded login, prefixed by the login.
+        """
+
+        return self.__stream__(
+            self.QUERIES["users_actions"], self.__days_params__(since, until)
+        )
+
+
+    def get_all_users_comments_info(self) -> Iterator[tuple]:
+        """
+        Retrieves comments information of every user in user order.
+
+        Comments are read in a single scan of the comment_author_idx 
+        index, so rows come ordered by user without sorting, and are 
+        fetched lazily while they are consumed.
+
+        Returns:
+            Iterator[tuple]: The rows of get_user_comments_info() of every 
+                             user, prefixed by the ID of the user.
         """
 
-        self.cursor.execute(query)
-        return self.cursor.fetchall()
+        return self.__stream__(self.QUERIES["all_users_comments"])
+
+
+    def get_all_users_actions_info(self, 
+            since: datetime.date | None = None,
+            until: datetime.date | None = None
+    ) -> Iterator[tuple]:
+        """
+        Retrieves actions information of every user in user order.
+
+        The daily activity rollup is already grouped by user and day, so 
+        it is read in a single scan of its primary key, and rows are 
+        fetched lazily while they are consumed.
+
+        Args:
+            since (datetime.date | None): The first day to retrieve, or 
+                                          None for the first day of the 
+                                          history. Defaults to None.
+            until (datetime.date | None): The last day to retrieve, or None 
+                                          for the last day of the history. 
+                                          Defaults to None.
+
+        Returns:
+            Iterator[tuple]: The rows of get_user_actions_info() of every 
+                             user, prefixed by the ID of the user.
+        """
+
+        return self.__stream__(
+            self.QUERIES["all_users_actions"], 
+            self.__days_params__(since, until)
+        )
@@ -0,0 +1,363 @@
+"""
+Module for generating chunks of dummy rows.
+
+This module turns the random data of a provider into rows ready to be
+inserted by DBInterface. Every chunk is generated from its own seed, so
+chunks may be produced in worker processes in parallel while a single
+writer inserts them in their original order.
+
+Filling is a pipeline of generators: chunks are generated one at a time,
+encoded into rows lazily, and inserted before the next chunk is taken,
+so at most one chunk per stage is held in memory whatever the number of
+rows is. A chunk holds a list of columns for every table it fills, which
+is cheaper to build and to pass between processes than a list of rows.
+
+
+Attributes:
+    GENERATORS   (dict[str, Callable]): The row generators by chunk kind.
+    WORKER_STATE (dict): The provider and the referenced ids of a worker 
+                         process, set by init_worker().
+
+Functions:
+    - generate_users(): Generates rows of users.
+    - generate_blogs(): Generates rows of blogs.
+    - generate_posts(): Generates rows of posts and their logs.
+    - generate_comments(): Generates rows of comments and their logs.
+    - generate_logins(): Generates rows of login or logout logs.
+    - run_task(): Generates a chunk of rows described by a task.
+    - init_worker(): Prepares a worker process for generating chunks.
+    - run_worker_task(): Generates a chunk of rows described by a task in 
+                         a worker process.
+    - generate_chunks(): Generates chunks of rows, optionally in parallel.
+    - encode_rows(): Encodes columns of a table into rows.
+"""
+
+import collections
+import datetime
+import multiprocessing
+from collections.abc import Iterable, Iterator
+
+from . import misc
+
+def generate_users(
+        provider: misc.FakeDataProvider | misc.SyntheticDataProvider,
+        context: dict,
+        size: int
+) -> tuple[list[list]]:
+    """
+    Generates rows of users.
+
+    Args:
+        provider (misc.FakeDataProvider | misc.SyntheticDataProvider):
+            The generator of random data.
+        context  (dict): The referenced ids, unused for users.
+        size     (int): The number of users to generate.
+
+    Returns:
+        tuple[list[list]]: The columns of the main.users table.
+    """
+
+    logins = provider.names(size)
+    emails = [
+        login.lower().replace(" ", "_")+"@example.com" for login in logins
+    ]
+
+    return ([emails, logins],)
+
+
+def generate_blogs(
+        provider: misc.FakeDataProvider | misc.SyntheticDataProvider,
+        context: dict,
+        size: int
+) -> tuple[list[list]]:
+    """
+    Generates rows of blogs.
+
+    Args:
+        provider (misc.FakeDataProvider | misc.SyntheticDataProvider):
+            The generator of random data.
+        context  (dict): The referenced ids with the "user_ids" key.
+        size     (int): The number of blogs to generate.
+
+    Returns:
+        tuple[list[list]]: The columns of the main.blog table.
+    """
+
+    blogs = [
+        provider.random.choices(context["user_ids"], k=size),
+        provider.sentences(size),
+        provider.paragraphs(size)
+    ]
+
+    return (blogs,)
+
+
+def generate_posts(
+        provider: misc.FakeDataProvider | misc.SyntheticDataProvider,
+        context: dict,
+        size: int
+) -> tuple[list[list], list[list]]:
+    """
+    Generates rows of posts and logs of their creation and removal.
+
+    Args:
+        provider (misc.FakeDataProvider | misc.SyntheticDataProvider):
+            The generator of random data.
+        context  (dict): The referenced ids with the "user_ids" and
+                         "blog_ids" keys.
+        size     (int): The number of posts to generate.
+
+    Returns:
+        tuple[list[list], list[list]]: The columns of the main.post and
+                                       logging.logs tables.
+    """
+
+    authors = provider.random.choices(context["user_ids"], k=size)
+    created = provider.epochs(size, "-2d", "now")
+
+    posts = [
+        provider.sentences(size),
+        provider.paragraphs(size),
+        authors,
+        provider.random.choices(context["blog_ids"], k=size)
+    ]
+
+    #Randomly remove posts
+    removers = [
+        user_id for user_id in authors if provider.random.randint(0, 3) == 1
+    ]
+    removed = provider.epochs(len(removers), "+1d", "+4d")
+    timestamps = created + removed
+
+    logs = [
+        misc.format_timestamps(timestamps),
+        timestamps,
+        authors + removers,
+        [2] * (size + len(removers)),
+        [3] * size + [4] * len(removers)
+    ]
+
+    return posts, logs
+
+
+def generate_comments(
+        provider: misc.FakeDataProvider | misc.SyntheticDataProvider,
+        context: dict,
+        size: int
+) -> tuple[list[list], list[list]]:
+    """
+    Generates rows of comments and logs of commenting.
+
+    Args:
+        provider (misc.FakeDataProvider | misc.SyntheticDataProvider):
+            The generator of random data.
+        context  (dict): The referenced ids with the "user_ids" and
+                         "post_ids" keys.
+        size     (int): The number of comments to generate.
+
+    Returns:
+        tuple[list[list], list[list]]: The columns of the main.comment and
+                                       logging.logs tables.
+    """
+
+    user_ids = context["user_ids"]
+
+    comments = [
+        provider.paragraphs(size),
+        provider.random.choices(user_ids, k=size),
+        provider.random.choices(context["post_ids"], k=size)
+    ]
+    timestamps = provider.epochs(size, "now", "+1d")
+    logs = [
+        misc.format_timestamps(timestamps),
+        timestamps,
+        provider.random.choices(user_ids, k=size),
+        [3] * size,
+        [2] * size
+    ]
+
+    return comments, logs
+
+
+def generate_logins(
+        provider: misc.FakeDataProvider | misc.SyntheticDataProvider,
+        context: dict,
+        start: int,
+        stop: int,
+        is_login: bool = True
+) -> tuple[list[list]]:
+    """
+    Generates rows of login or logout logs for a slice of users.
+
+    Args:
+        provider (misc.FakeDataProvider | misc.SyntheticDataProvider):
+            The generator of random data.
+        context  (dict): The referenced ids with the "user_ids" key.
+        start    (int): The index of the first user of the slice.
+        stop     (int): The index after the last user of the slice.
+        is_login (bool): If True, generates login data; otherwise,
+                         generates logout data.
+
+    Returns:
+        tuple[list[list]]: The columns of the logging.logs table.
+    """
+
+    user_ids = context["user_ids"][start:stop]
+    date_range = [("-5d", "now"), ("now", "+5d")][not is_login]
+    state = 1 if is_login else 5
+
+    timestamps = provider.epochs(len(user_ids), *date_range)
+
+    logs = [
+        misc.format_timestamps(timestamps),
+        timestamps,
+        user_ids,
+        [1] * len(user_ids),
+        [state] * len(user_ids)
+    ]
+
+    return (logs,)
+
+
+GENERATORS = {
+    "users": generate_users,
+    "blogs": generate_blogs,
+    "posts": generate_posts,
+    "comments": generate_comments,
+    "logins": generate_logins,
+}
+
+WORKER_STATE = {}
+
+
+def run_task(
+        provider: misc.FakeDataProvider | misc.SyntheticDataProvider,
+        context: dict,
+        task: tuple[str, int, tuple]
+) -> tuple[list[list], ...]:
+    """
+    Generates a chunk of rows described by a task.
+
+    Args:
+        provider (misc.FakeDataProvider | misc.SyntheticDataProvider):
+            The generator of random data.
+        context  (dict): The referenced ids.
+        task     (tuple[str, int, tuple]): The kind of the chunk, the seed
+                                           of the chunk and the arguments
+                                           of its generator.
+
+    Returns:
+        tuple[list[list], ...]: The columns of every table of the chunk.
+    """
+
+    kind, seed, args = task
+    provider.seed(seed)
+
+    return GENERATORS[kind](provider, context, *args)
+
+
+def init_worker(
+        generator: str, 
+        context: dict, 
+        now: datetime.datetime | None = None
+) -> None:
+    """
+    Prepares a worker process for generating chunks.
+
+    Args:
+        generator (str): The generator mode of random data.
+        context   (dict): The referenced ids.
+        now       (datetime.datetime | None): The moment relative dates are 
+                                              counted from, or None for the 
+                                              current date and time.
+    """
+
+    WORKER_STATE["provider"] = misc.get_provider(generator)
+    WORKER_STATE["provider"].now = now
+    WORKER_STATE["context"] = context
+
+
+def run_worker_task(task: tuple[str, int, tuple]) -> tuple[list[list], ...]:
+    """
+    Generates a chunk of rows described by a task in a worker process.
+
+    Args:
+        task (tuple[str, int, tuple]): The task of the chunk.
+
+    Returns:
+        tuple[list[list], ...]: The columns of every table of the chunk.
+    """
+
+    return run_task(WORKER_STATE["provider"], WORKER_STATE["context"], task)
+
+
+def generate_chunks(
+        tasks: Iterable[tuple[str, int, tuple]],
+        generator: str,
+        context: dict,
+        workers: int = 1,
+        now: datetime.datetime | None = None
+) -> Iterator[tuple[list[list], ...]]:
+    """
+    Generates chunks of rows, optionally in parallel worker processes.
+
+    Chunks are yielded in the order of their tasks. With several workers,
+    at most two chunks per worker are in flight at once, so a slow writer
+    does not let generated chunks pile up in memory. As every chunk is
+    generated from the seed of its task, the chunks do not depend on the
+    number of workers.
+
+    Args:
+        tasks     (Iterable[tuple[str, int, tuple]]): The tasks of chunks.
+        generator (str): The generator mode of random data.
+        context   (dict): The referenced ids.
+        workers   (int): The number of worker processes. With 1 worker,
+                         chunks are generated in the calling process.
+                         Defaults to 1.
+        now       (datetime.datetime | None): The moment relative dates of
+                                              worker processes are counted
+                                              from. Defaults to None, the
+                                              current date and time.
+
+    Yields:
+        tuple[list[list], ...]: The columns of every table of the next 
+                                chunk.
+    """
+
+    if workers <= 1:
+        provider = misc.get_provider(generator)
+        for task in tasks:
+            yield run_task(provider, context, task)
+        return
+
+    with multiprocessing.Pool(
+            workers, 
+            initializer=init_worker, 
+            initargs=(generator, context, now)
+    ) as pool:
+        pending = collections.deque()
+
+        for task in tasks:
+            pending.append(pool.apply_async(run_worker_task, (task,)))
+            if len(pending) >= 2*workers:
+                yield pending.popleft().get()
+
+        while pending:
+            yield pending.popleft().get()
+
+
+def encode_rows(columns: list[list]) -> Iterator[tuple]:
+    """
+    Encodes columns of a table into rows.
+
+    Rows are produced lazily while they are bound to an insert query, so 
+    they never exist all at once next to the columns of the chunk.
+
+    Args:
+        columns (list[list]): The columns of the table.
+
+    Returns:
+        Iterator[tuple]: The rows of the table.
+    """
+
+    return zip(*columns)
@@ -2,13 +2,35 @@
 Module providing utility functions for generating random data.
 
 This module contains functions for generating random names, sentences, 
-descriptions, and dates.
+descriptions, and dates. Bulk consumers should use the shared provider 
+returned by get_provider(), which generates values in batches.
+
+Values come either from the faker and lorem libraries or from a built-in 
+synthetic generator drawing from the word lists of the words module, 
+which needs no third-party packages.
 
 Attributes:
-    is_lorem (bool): Indicates whether the lorem module is available.
-    is_faker (bool): Indicates whether the faker module is available.
+    is_lorem        (bool): Indicates whether the lorem module is available.
+    is_faker        (bool): Indicates whether the faker module is available.
+    is_numpy        (bool): Indicates whether the numpy module is available.
+    GENERATOR_MODES (tuple[str]): The names of supported generator modes.
+    REFERENCE_DATE  (datetime.datetime): The moment relative dates are 
+                                         counted from in reproducible runs.
+
+Classes:
+    DataProvider: A base class of providers with shared date methods.
+    FakeDataProvider: A class for generating batches of random data 
+                      with the faker and lorem libraries.
+    SyntheticDataProvider: A class for generating batches of random data 
+                           from bundled word lists.
 
 Functions:
+    - get_provider(): Returns the shared provider of the process.
+    - rank_weights(): Builds cumulative rank-frequency weights.
+    - resolve_date(): Resolves a relative date into a date and time.
+    - random_timestamps(): Generates random timestamps within a range.
+    - format_hour(): Formats the date and hour part of dates and times.
+    - format_timestamps(): Formats timestamps into dates and times.
     - get_name(): Generates a random name.
     - get_sentence(): Generates a random sentence.
     - get_description(): Generates a random description.
@@ -16,6 +38,13 @@ Functions:
 """
 
 import datetime
+import functools
+import itertools
+import random
+import re
+from collections.abc import Sequence
+
+from . import words
 
 try:
     import lorem
@@ -29,6 +58,557 @@ try:
 except ModuleNotFoundError:
     is_faker = False
 
+try:
+    import numpy
+    is_numpy = True
+except ModuleNotFoundError:
+    is_numpy = False
+
+DATE_UNITS = {
+    "y": 365*24*60*60, 
+    "M": 30*24*60*60, 
+    "w": 7*24*60*60, 
+    "d": 24*60*60, 
+    "h": 60*60, 
+    "m": 60, 
+    "s": 1
+}
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+MINUTES_SECONDS = [
+    f"{minute:02}:{second:02}" for minute in range(60) for second in range(60)
+]
+
+if is_numpy:
+    MINUTES_SECONDS_TABLE = numpy.array(MINUTES_SECONDS)
+
+def rank_weights(count: int, exponent: float = 1.0) -> list[float]:
+    """
+    Builds cumulative weights following the rank-frequency (Zipf) law.
+
+    Args:
+        count    (int): The number of ranked values.
+        exponent (float): The exponent of the law. Defaults to 1.0.
+
+    Returns:
+        list[float]: The cumulative weights suitable for random.choices.
+    """
+
+    return list(itertools.accumulate(
+        1 / rank ** exponent for rank in range(1, count+1)
+    ))
+
+
+def resolve_date(
+        value: str | datetime.datetime, 
+        now: datetime.datetime | None = None
+) -> datetime.datetime:
+    """
+    Resolves a date in the Faker relative format into a date and time.
+
+    Relative dates are "now" or a signed sequence of amounts with units: 
+    years (y), months (M), weeks (w), days (d), hours (h), minutes (m) 
+    and seconds (s), for example "-2d" or "+1w3d".
+
+    Args:
+        value (str | datetime.datetime): The date to resolve.
+        now   (datetime.datetime | None): The moment relative dates are 
+                                          counted from. Defaults to the 
+                                          current date and time.
+
+    Returns:
+        datetime.datetime: The resolved date and time.
+
+    Raises:
+        ValueError: If the value is not in the relative format.
+    """
+
+    if isinstance(value, datetime.datetime):
+        return value
+
+    if now is None:
+        now = datetime.datetime.now()
+
+    if value == "now":
+        return now
+
+    match = re.fullmatch(r"([+-])((?:\d+[yMwdhms])+)", value)
+    if match is None:
+        raise ValueError(f"Unknown relative date: {value}")
+
+    seconds = sum(
+        int(amount) * DATE_UNITS[unit] 
+        for amount, unit in re.findall(r"(\d+)([yMwdhms])", match[2])
+    )
+    sign = -1 if match[1] == "-" else 1
+
+    return now + datetime.timedelta(seconds=sign*seconds)
+
+
+def random_timestamps(
+        generator: random.Random,
+        count: int,
+        starts: datetime.datetime,
+        ends: datetime.datetime
+) -> Sequence[int]:
+    """
+    Generates random timestamps within a specified range.
+
+    The range is converted into integer seconds once, and all timestamps 
+    are drawn in a single call, vectorized by NumPy when it is available.
+
+    Args:
+        generator (random.Random): The random number generator, which also 
+                                   seeds the NumPy generator.
+        count     (int): The number of timestamps to generate.
+        starts    (datetime.datetime): The start of the range.
+        ends      (datetime.datetime): The end of the range.
+
+    Returns:
+        Sequence[int]: The timestamps as seconds since the epoch, as a 
+                       NumPy array if NumPy is available.
+    """
+
+    start = (starts - EPOCH) // datetime.timedelta(seconds=1)
+    end = (ends - EPOCH) // datetime.timedelta(seconds=1)
+
+    if is_numpy:
+        numpy_generator = numpy.random.default_rng(generator.getrandbits(64))
+        return numpy_generator.integers(start, end, size=count, endpoint=True)
+
+    return generator.choices(range(start, end+1), k=count)
+
+
+def format_hour(hour: int) -> str:
+    """
+    Formats the date and hour part of dates and times of the logs table.
+
+    Args:
+        hour (int): The number of hours since the epoch.
+
+    Returns:
+        str: The date and hour formatted as "YYYY-MM-DD HH:".
+    """
+
+    return (EPOCH + datetime.timedelta(hours=hour)).strftime("%Y-%m-%d %H:")
+
+
+def format_timestamps(timestamps: Sequence[int]) -> list[str]:
+    """
+    Formats timestamps into dates and times of the logs table.
+
+    Timestamps are formatted as "YYYY-MM-DD HH:MM:SS". The date and hour 
+    part is formatted once per distinct hour and the rest is taken from a 
+    precomputed table, so no timestamp is parsed or formatted on its own.
+
+    Args:
+        timestamps (Sequence[int]): The timestamps as seconds since the epoch.
+
+    Returns:
+        list[str]: The formatted dates and times.
+    """
+
+    if is_numpy:
+        values = numpy.asarray(timestamps, dtype=numpy.int64)
+        hours, inverse = numpy.unique(values // 3600, return_inverse=True)
+        prefixes = numpy.array(
+            [format_hour(hour) for hour in hours.tolist()], dtype=str
+        )
+
+        return numpy.char.add(
+            prefixes[inverse], MINUTES_SECONDS_TABLE[values % 3600]
+        ).tolist()
+
+    prefixes = {}
+    result = []
+
+    for timestamp in timestamps:
+        hour = timestamp // 3600
+        prefix = prefixes.get(hour)
+
+        if prefix is None:
+            prefix = prefixes[hour] = format_hour(hour)
+
+        result.append(prefix + MINUTES_SECONDS[timestamp - hour*3600])
+
+    return result
+
+
+class DataProvider:
+    """
+    A base of generators of random data with the date methods they share.
+
+    Subclasses set the random and now attributes when initialized.
+
+    Attributes:
+        random (random.Random): The random number generator of the provider.
+        now    (datetime.datetime | None): The moment relative dates are 
+                                           counted from, or None for the 
+                                           current date and time.
+
+    Methods:
+        - epochs(): Generates random timestamps within a range as seconds 
+                    since the epoch.
+    """
+
+    def epochs(self, 
+            count: int, 
+            starts: str = "-5d", 
+            ends: str = "now"
+    ) -> list[int]:
+        """
+        Generates random timestamps within a range as seconds since the 
+        epoch.
+
+        Args:
+            count  (int): The number of timestamps to generate.
+            starts (str): The start date for the date range. 
+                          Defaults to "-5d" (5 days ago).
+            ends   (str): The end date for the date range. 
+                          Defaults to "now" (current date and time).
+
+        Returns:
+            list[int]: A list of randomly generated timestamps.
+        """
+
+        now = self.now or datetime.datetime.now()
+
+        timestamps = random_timestamps(
+            self.random, count, 
+            resolve_date(starts, now), resolve_date(ends, now)
+        )
+
+        return timestamps.tolist() if is_numpy else timestamps
+
+
+class FakeDataProvider(DataProvider):
+    """
+    A generator of random data producing values in batches.
+
+    Building a Faker instance loads all of its providers, so the instance 
+    is created once and reused for every generated value.
+
+    Attributes:
+        faker  (faker.Faker | None): The Faker instance, or None if the 
+                                     faker module is not available.
+        random (random.Random): The random number generator of the provider.
+        now    (datetime.datetime | None): The moment relative dates are 
+                                           counted from, or None for the 
+                                           current date and time.
+
+    Methods:
+        - seed(): Seeds every random number generator used by the provider.
+        - names(): Generates random names.
+        - sentences(): Generates random sentences.
+        - paragraphs(): Generates random paragraphs.
+        - datetimes_between(): Generates random dates within a range.
+    """
+
+    def __init__(self):
+        """
+        Initializes the FakeDataProvider instance.
+        """
+
+        self.faker = faker.Faker() if is_faker else None
+        self.random = random.Random()
+        self.now = None
+
+
+    def seed(self, value: int) -> None:
+        """
+        Seeds every random number generator used by the provider.
+
+        The lorem module draws from the global random number generator, 
+        so it is seeded as well.
+
+        Args:
+            value (int): The seed.
+        """
+
+        self.random.seed(value)
+        random.seed(value)
+
+        if self.faker is not None:
+            self.faker.seed_instance(value)
+
+
+    def names(self, count: int) -> list[str]:
+        """
+        Generates random names.
+
+        Args:
+            count (int): The number of names to generate.
+
+        Returns:
+            list[str]: A list of randomly generated names.
+        """
+
+        if self.faker is None:
+            return ["User Name"] * count
+
+        return [self.faker.name() for _ in range(count)]
+
+
+    def sentences(self, count: int) -> list[str]:
+        """
+        Generates random sentences.
+
+        Args:
+            count (int): The number of sentences to generate.
+
+        Returns:
+            list[str]: A list of randomly generated sentences.
+        """
+
+        if not is_lorem:
+            return ["Random sentence"] * count
+
+        return [lorem.sentence() for _ in range(count)]
+
+
+    def paragraphs(self, count: int) -> list[str]:
+        """
+        Generates random paragraphs.
+
+        Args:
+            count (int): The number of paragraphs to generate.
+
+        Returns:
+            list[str]: A list of randomly generated paragraphs.
+        """
+
+        if not is_lorem:
+            return ["Random description"] * count
+
+        return [lorem.paragraph() for _ in range(count)]
+
+
+    def datetimes_between(self, 
+            count: int, 
+            starts: str = "-5d", 
+            ends: str = "now"
+    ) -> list[datetime.datetime]:
+        """
+        Generates random dates within a specified range.
+
+        Args:
+            count  (int): The number of dates to generate.
+            starts (str): The start date for the date range. 
+                          Defaults to "-5d" (5 days ago).
+            ends   (str): The end date for the date range. 
+                          Defaults to "now" (current date and time).
+
+        Returns:
+            list[datetime.datetime]: A list of randomly generated dates.
+        """
+
+        now = self.now or datetime.datetime.now()
+
+        if self.faker is None:
+            return [now] * count
+
+        start = resolve_date(starts, now)
+        end = resolve_date(ends, now)
+
+        return [
+            self.faker.date_time_between(start_date=start, end_date=end)
+            for _ in range(count)
+        ]
+
+
+class SyntheticDataProvider(DataProvider):
+    """
+    A generator of random data drawing values from bundled word lists.
+
+    Words and names are drawn with a single random.choices call per batch 
+    over precomputed rank-frequency tables, so texts vary in length and 
+    vocabulary like natural language while staying cheap to produce.
+
+    Attributes:
+        random (random.Random): The random number generator of the provider.
+        now    (datetime.datetime | None): The moment relative dates are 
+                                           counted from, or None for the 
+                                           current date and time.
+
+    Methods:
+        - seed(): Seeds the random number generator of the provider.
+        - names(): Generates random names.
+        - sentences(): Generates random sentences.
+        - paragraphs(): Generates random paragraphs.
+        - datetimes_between(): Generates random dates within a range.
+    """
+
+    SENTENCE_LENGTHS = range(4, 13)
+    PARAGRAPH_LENGTHS = range(4, 11)
+
+    FIRST_NAME_WEIGHTS = rank_weights(len(words.FIRST_NAMES), 0.5)
+    LAST_NAME_WEIGHTS = rank_weights(len(words.LAST_NAMES), 0.5)
+    WORD_WEIGHTS = rank_weights(len(words.WORDS))
+
+    def __init__(self):
+        """
+        Initializes the SyntheticDataProvider instance.
+        """
+
+        self.random = random.Random()
+        self.now = None
+
+
+    def seed(self, value: int) -> None:
+        """
+        Seeds the random number generator of the provider.
+
+        Args:
+            value (int): The seed.
+        """
+
+        self.random.seed(value)
+
+
+    def names(self, count: int) -> list[str]:
+        """
+        Generates random names.
+
+        Args:
+            count (int): The number of names to generate.
+
+        Returns:
+            list[str]: A list of randomly generated names.
+        """
+
+        first_names = self.random.choices(
+            words.FIRST_NAMES, cum_weights=self.FIRST_NAME_WEIGHTS, k=count
+        )
+        last_names = self.random.choices(
+            words.LAST_NAMES, cum_weights=self.LAST_NAME_WEIGHTS, k=count
+        )
+
+        return [
+            f"{first_name} {last_name}" 
+            for first_name, last_name in zip(first_names, last_names)
+        ]
+
+
+    def sentences(self, count: int) -> list[str]:
+        """
+        Generates random sentences.
+
+        Args:
+            count (int): The number of sentences to generate.
+
+        Returns:
+            list[str]: A list of randomly generated sentences.
+        """
+
+        lengths = self.random.choices(self.SENTENCE_LENGTHS, k=count)
+        vocabulary = self.random.choices(
+            words.WORDS, cum_weights=self.WORD_WEIGHTS, k=sum(lengths)
+        )
+
+        result = []
+        position = 0
+
+        for length in lengths:
+            sentence = " ".join(vocabulary[position:position+length])
+            result.append(sentence.capitalize() + ".")
+            position += length
+
+        return result
+
+
+    def paragraphs(self, count: int) -> list[str]:
+        """
+        Generates random paragraphs.
+
+        Args:
+            count (int): The number of paragraphs to generate.
+
+        Returns:
+            list[str]: A list of randomly generated paragraphs.
+        """
+
+        lengths = self.random.choices(self.PARAGRAPH_LENGTHS, k=count)
+        sentences = self.sentences(sum(lengths))
+
+        result = []
+        position = 0
+
+        for length in lengths:
+            result.append(" ".join(sentences[position:position+length]))
+            position += length
+
+        return result
+
+
+    def datetimes_between(self, 
+            count: int, 
+            starts: str = "-5d", 
+            ends: str = "now"
+    ) -> list[datetime.datetime]:
+        """
+        Generates random dates within a specified range.
+
+        Args:
+            count  (int): The number of dates to generate.
+            starts (str): The start date for the date range. 
+                          Defaults to "-5d" (5 days ago).
+            ends   (str): The end date for the date range. 
+                          Defaults to "now" (current date and time).
+
+        Returns:
+            list[datetime.datetime]: A list of randomly generated dates.
+        """
+
+        now = self.now or datetime.datetime.now()
+        start = resolve_date(starts, now)
+        span = int((resolve_date(ends, now) - start).total_seconds())
+
+        return [
+            start + datetime.timedelta(seconds=int(value * span))
+            for value in (self.random.random() for _ in range(count))
+        ]
+
+
+GENERATOR_MODES = ("auto", "library", "synthetic")
+
+REFERENCE_DATE = datetime.datetime(2024, 1, 1)
+
+
+@functools.cache
+def get_provider(
+        mode: str = "auto"
+) -> FakeDataProvider | SyntheticDataProvider:
+    """
+    Returns the provider shared by the whole process.
+
+    Args:
+        mode (str): The generator mode: "library" for the faker and lorem 
+                    libraries, "synthetic" for bundled word lists, or 
+                    "auto" to use the libraries only if both are 
+                    available. Defaults to "auto".
+
+    Returns:
+        FakeDataProvider | SyntheticDataProvider: The provider for the 
+                                                  mode, created on the 
+                                                  first call.
+
+    Raises:
+        ValueError: If the mode is not supported.
+    """
+
+    if mode not in GENERATOR_MODES:
+        raise ValueError(f"Unknown generator mode: {mode}")
+
+    if mode == "auto":
+        mode = "library" if is_faker and is_lorem else "synthetic"
+
+    if mode == "library":
+        return FakeDataProvider()
+
+    return SyntheticDataProvider()
+
+
 def get_name() -> str:
     """
     Generates a random name.
@@ -37,10 +617,7 @@ def get_name() -> str:
         str: A randomly generated name.
     """
 
-    if not is_faker:
-        return "User Name"
-    
-    return faker.Faker().name()
+    return get_provider().names(1)[0]
 
 
 def get_sentence() -> str:
@@ -51,10 +628,7 @@ def get_sentence() -> str:
         str: A randomly generated sentence.
     """
 
-    if not is_lorem:
-        return "Random sentence"
-    
-    return lorem.sentence()
+    return get_provider().sentences(1)[0]
 
 
 def get_description() -> str:
@@ -65,10 +639,7 @@ def get_description() -> str:
         str: A randomly generated description.
     """
 
-    if not is_lorem:
-        return "Random description"
-    
-    return lorem.paragraph()
+    return get_provider().paragraphs(1)[0]
 
 
 def get_random_date(starts="-5d", ends="now") -> datetime.datetime:
@@ -85,7 +656,4 @@ def get_random_date(starts="-5d", ends="now") -> datetime.datetime:
         datetime.datetime: A randomly generated date and time.
     """
 
-    if not is_faker:
-        return datetime.datetime.now()
-    
-    return faker.Faker().date_time_between(start_date=starts, end_date=ends)
+    return get_provider().datetimes_between(1, starts, ends)[0]
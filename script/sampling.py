@@ -0,0 +1,87 @@
+"""
+Module for compact storage of table IDs sampled by fill methods.
+
+IDs of tables with INTEGER PRIMARY KEY are usually dense, so they are
+kept as a range, which costs the same whatever the number of IDs is and
+is sampled with plain arithmetic by random.choices. Only tables with
+gaps between IDs fall back to an array of 64-bit integers, which still
+costs 8 bytes per ID instead of a list of Python integers.
+
+
+Functions:
+    - read_ids(): Reads IDs of a table into a compact sequence.
+    - merge_ids(): Appends IDs to a compact sequence.
+"""
+
+import array
+import sqlite3
+
+def read_ids(
+        cursor: sqlite3.Cursor,
+        table_name: str,
+        after: int = 0
+) -> range | array.array:
+    """
+    Reads IDs of a table into a compact sequence.
+
+    Args:
+        cursor     (sqlite3.Cursor): The cursor for executing SQL statements.
+        table_name (str): The name of the table from which to read IDs.
+        after      (int): The ID after which IDs are read. Defaults to 0.
+
+    Returns:
+        range | array.array: The ascending IDs of the table, as a range if
+                             they are contiguous.
+    """
+
+    cursor.execute(
+        f"SELECT min(id), max(id), count(id) FROM {table_name} WHERE id > ?",
+        (after,)
+    )
+    low, high, count = cursor.fetchone()
+
+    if count == 0:
+        return range(after+1, after+1)
+
+    if high - low + 1 == count:
+        return range(low, high+1)
+
+    cursor.execute(
+        f"SELECT id FROM {table_name} WHERE id > ? ORDER BY id", (after,)
+    )
+    return array.array("q", (pair[0] for pair in cursor))
+
+
+def merge_ids(
+        ids: range | array.array,
+        new_ids: range | array.array
+) -> range | array.array:
+    """
+    Appends IDs to a compact sequence.
+
+    Args:
+        ids     (range | array.array): The ascending IDs to append to.
+                                       Arrays are extended in place.
+        new_ids (range | array.array): The ascending IDs greater than ids.
+
+    Returns:
+        range | array.array: The ascending IDs of both sequences.
+    """
+
+    if not new_ids:
+        return ids
+
+    if not ids:
+        return new_ids
+
+    if (
+            isinstance(ids, range) and isinstance(new_ids, range)
+            and ids.stop == new_ids.start
+    ):
+        return range(ids.start, new_ids.stop)
+
+    if isinstance(ids, range):
+        ids = array.array("q", ids)
+
+    ids.extend(new_ids)
+    return ids
@@ -0,0 +1,98 @@
+"""
+Module with word lists bundled for synthetic data generation.
+
+The lists are ordered from the most to the least frequent entries, so
+generators may weight them by rank to obtain a realistic, non-uniform
+distribution of values.
+
+Attributes:
+    FIRST_NAMES (tuple[str]): Given names used for user names.
+    LAST_NAMES  (tuple[str]): Family names used for user names.
+    WORDS       (tuple[str]): Words used for sentences and paragraphs.
+"""
+
+FIRST_NAMES = (
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael",
+    "Linda", "William", "Elizabeth", "David", "Barbara", "Richard", "Susan",
+    "Joseph", "Jessica", "Thomas", "Sarah", "Charles", "Karen", "Daniel",
+    "Nancy", "Matthew", "Lisa", "Anthony", "Betty", "Mark", "Margaret",
+    "Donald", "Sandra", "Steven", "Ashley", "Paul", "Kimberly", "Andrew",
+    "Emily", "Joshua", "Donna", "Kenneth", "Michelle", "Kevin", "Carol",
+    "Brian", "Amanda", "George", "Melissa", "Timothy", "Deborah", "Ronald",
+    "Stephanie", "Edward", "Rebecca", "Jason", "Sharon", "Jeffrey", "Laura",
+    "Ryan", "Cynthia", "Jacob", "Kathleen", "Gary", "Amy", "Nicholas",
+    "Angela", "Eric", "Shirley", "Jonathan", "Anna", "Stephen", "Brenda",
+    "Larry", "Pamela", "Justin", "Emma", "Scott", "Nicole", "Brandon",
+    "Helen", "Benjamin", "Samantha", "Samuel", "Katherine", "Gregory",
+    "Christine", "Alexander", "Debra", "Frank", "Rachel", "Patrick",
+    "Carolyn", "Raymond", "Janet", "Jack", "Catherine", "Dennis", "Maria",
+    "Jerry", "Heather", "Tyler", "Diane", "Aaron", "Ruth", "Jose", "Julie",
+    "Adam", "Olivia", "Nathan", "Joyce", "Henry", "Virginia", "Douglas",
+    "Victoria", "Zachary", "Kelly", "Peter", "Lauren", "Kyle", "Christina",
+    "Ethan", "Joan", "Walter", "Evelyn", "Noah", "Judith", "Jeremy",
+    "Megan", "Christian", "Andrea", "Keith", "Cheryl", "Roger", "Hannah",
+    "Terry", "Jacqueline", "Gerald", "Martha", "Harold", "Gloria", "Sean",
+    "Teresa", "Austin", "Ann", "Carl", "Sara", "Arthur", "Madison",
+    "Lawrence", "Frances", "Dylan", "Kathryn", "Jesse", "Janice", "Jordan",
+    "Jean", "Bryan", "Abigail", "Billy", "Alice", "Joe", "Judy", "Bruce",
+    "Sophia", "Gabriel", "Grace", "Logan", "Denise", "Albert", "Amber",
+)
+
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller",
+    "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez",
+    "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark",
+    "Ramirez", "Lewis", "Robinson", "Walker", "Young", "Allen", "King",
+    "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores", "Green",
+    "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell", "Mitchell",
+    "Carter", "Roberts", "Gomez", "Phillips", "Evans", "Turner", "Diaz",
+    "Parker", "Cruz", "Edwards", "Collins", "Reyes", "Stewart", "Morris",
+    "Morales", "Murphy", "Cook", "Rogers", "Gutierrez", "Ortiz", "Morgan",
+    "Cooper", "Peterson", "Bailey", "Reed", "Kelly", "Howard", "Ramos",
+    "Kim", "Cox", "Ward", "Richardson", "Watson", "Brooks", "Chavez",
+    "Wood", "James", "Bennett", "Gray", "Mendoza", "Ruiz", "Hughes",
+    "Price", "Alvarez", "Castillo", "Sanders", "Patel", "Myers", "Long",
+    "Ross", "Foster", "Jimenez", "Powell", "Jenkins", "Perry", "Russell",
+    "Sullivan", "Bell", "Coleman", "Butler", "Henderson", "Barnes",
+    "Gonzales", "Fisher", "Vasquez", "Simmons", "Romero", "Jordan",
+    "Patterson", "Alexander", "Hamilton", "Graham", "Reynolds", "Griffin",
+    "Wallace", "Moreno", "West", "Cole", "Hayes", "Bryant", "Herrera",
+    "Gibson", "Ellis", "Tran", "Medina", "Aguilar", "Stevens", "Murray",
+    "Ford", "Castro", "Marshall", "Owens", "Harrison", "Fernandez",
+    "McDonald", "Woods", "Washington", "Kennedy", "Wells", "Vargas",
+    "Henry", "Chen", "Freeman", "Webb", "Tucker", "Guzman", "Burns",
+    "Crawford", "Olson", "Simpson", "Porter", "Hunter", "Gordon", "Mendez",
+)
+
+WORDS = (
+    "et", "in", "est", "non", "ut", "sed", "quia", "dolor", "amet", "sit",
+    "eius", "magnam", "neque", "velit", "ipsum", "dolore", "numquam",
+    "quaerat", "porro", "modi", "tempora", "aliquam", "labore", "dolorem",
+    "adipisci", "quisquam", "consectetur", "voluptatem", "etincidunt",
+    "ea", "qui", "id", "ad", "nisi", "enim", "minima", "nostrum", "autem",
+    "vel", "eum", "iure", "quam", "nihil", "esse", "illum", "fugiat",
+    "nulla", "pariatur", "quo", "voluptas", "natus", "error", "omnis",
+    "iste", "unde", "totam", "rem", "aperiam", "eaque", "ipsa", "ab",
+    "illo", "inventore", "veritatis", "quasi", "architecto", "beatae",
+    "vitae", "dicta", "sunt", "explicabo", "nemo", "ipsam", "voluptates",
+    "aspernatur", "aut", "odit", "fugit", "consequuntur", "magni",
+    "dolores", "eos", "ratione", "sequi", "nesciunt", "dignissimos",
+    "ducimus", "blanditiis", "praesentium", "deleniti", "atque",
+    "corrupti", "quos", "quas", "molestias", "excepturi", "sint",
+    "occaecati", "cupiditate", "provident", "similique", "culpa",
+    "officia", "deserunt", "mollitia", "animi", "laborum", "dolorum",
+    "fuga", "harum", "quidem", "rerum", "facilis", "expedita",
+    "distinctio", "nam", "libero", "tempore", "cum", "soluta", "nobis",
+    "eligendi", "optio", "cumque", "impedit", "minus", "maxime",
+    "placeat", "facere", "possimus", "assumenda", "repellendus",
+    "temporibus", "quibusdam", "officiis", "debitis", "necessitatibus",
+    "saepe", "eveniet", "repudiandae", "recusandae",
+    "itaque", "earum", "hic", "tenetur", "sapiente", "delectus",
+    "reiciendis", "voluptatibus", "maiores", "alias", "perferendis",
+    "doloribus", "asperiores", "repellat", "accusamus", "iusto", "odio",
+    "ullam", "corporis", "suscipit", "laboriosam", "commodi",
+    "consequatur", "quis", "nostrud", "exercitationem", "reprehenderit",
+    "voluptate", "accusantium", "doloremque", "laudantium", "quae",
+    "ex", "perspiciatis", "at", "vero", "obcaecati", "a",
+)